@@ -0,0 +1,25 @@
+-- Migration: Add a function returning all uploader statistics in one call
+-- Created: 2026-10-15
+-- Purpose: Let the uploader fetch its five summary counts with a single RPC
+--          instead of five separate count queries (one round trip each)
+
+-- p_today is passed in by the uploader so "today" matches the scraper's clock,
+-- not the database server's time zone
+CREATE OR REPLACE FUNCTION intern_stats(p_today DATE)
+RETURNS TABLE (
+    total_jobs BIGINT,
+    jobs_posted_today BIGINT,
+    jobs_scraped_today BIGINT,
+    total_users BIGINT,
+    total_applications BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        (SELECT COUNT(*) FROM intern_jobs),
+        (SELECT COUNT(*) FROM intern_jobs WHERE posted_date = p_today),
+        (SELECT COUNT(*) FROM intern_jobs WHERE scraped_date = p_today),
+        (SELECT COUNT(*) FROM intern_users),
+        (SELECT COUNT(*) FROM intern_applications);
+$$;
@@ -0,0 +1,43 @@
+"""
+Runtime configuration - credentials and endpoints read from the environment
+Snapshotted once at import and passed to components explicitly; entry points
+load the .env file before importing this module (or build a fresh Config.from_env())
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Config:
+    """Immutable snapshot of the environment settings used across the pipeline"""
+
+    # Job APIs (optional - scrapers skip themselves when unset)
+    adzuna_app_id: Optional[str] = None
+    adzuna_app_key: Optional[str] = None
+    themuse_api_key: Optional[str] = None
+    jooble_api_key: Optional[str] = None
+
+    # Supabase
+    supabase_url: Optional[str] = None
+    supabase_key: Optional[str] = None
+
+    # Discord
+    discord_webhook_url: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> 'Config':
+        """Build a config from the current environment"""
+        return cls(
+            adzuna_app_id=os.getenv('ADZUNA_APP_ID'),
+            adzuna_app_key=os.getenv('ADZUNA_APP_KEY'),
+            themuse_api_key=os.getenv('THEMUSE_API_KEY'),
+            jooble_api_key=os.getenv('JOOBLE_API_KEY'),
+            supabase_url=os.getenv('SUPABASE_URL'),
+            supabase_key=os.getenv('SUPABASE_KEY'),
+            discord_webhook_url=os.getenv('DISCORD_WEBHOOK_URL'),
+        )
+
+
+CONFIG = Config.from_env()
@@ -3,17 +3,82 @@ Smart keyword filtering for UI/UX internships
 Uses weighted scoring to ensure high-quality matches
 """
 
+import re
+import heapq
+import functools
 import yaml
 import logging
-from typing import Dict, List, Tuple
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
 from pathlib import Path
 
+try:
+    # libyaml's C parser is much faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is a C extension; fall back to plain substring scans without it
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Default keyword config, resolved once at import
+_DEFAULT_CONFIG = Path(__file__).resolve().parent.parent.parent / 'data' / 'keywords.yml'
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(config_path: str) -> Dict:
+    """
+    Parse a keyword config once per path and share it between filter instances
+
+    Keyword lists are lowercased and frozen into tuples so the cached copy can't be
+    mutated through one instance.
+    """
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    return {
+        key: tuple(k.lower() for k in value) if isinstance(value, list) else value
+        for key, value in config.items()
+    }
+
+
+class _KeywordMatcher:
+    """Finds which of a fixed set of keywords occur in a text using one Aho-Corasick pass"""
+
+    def __init__(self, keywords: Iterable[str]):
+        # Dedupe while keeping config order (dict preserves insertion order)
+        self.keywords = tuple(dict.fromkeys(k for k in keywords if k))
+        self._automaton = None
+
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of keywords that appear anywhere in text"""
+        if self._automaton is None:
+            return {keyword for keyword in self.keywords if keyword in text}
+        return {keyword for _, keyword in self._automaton.iter(text)}
+
 
 class KeywordFilter:
     """Filters jobs based on keyword matching with scoring"""
 
+    # Points per matched keyword, by breakdown bucket
+    WEIGHTS = {
+        'title_matches': 3,         # UI/UX specific title
+        'title_excludes': -10,      # Not a relevant design role
+        'description_matches': 1,   # Tool or skill mentioned
+    }
+
     def __init__(self, config_path: str = None):
         """
         Initialize filter with keyword configuration
@@ -22,19 +87,84 @@ class KeywordFilter:
             config_path: Path to keywords.yml file. If None, uses default location.
         """
         if config_path is None:
-            config_path = Path(__file__).parent.parent.parent / 'data' / 'keywords.yml'
+            config_path = _DEFAULT_CONFIG
 
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = _load_config(str(config_path))
 
-        self.internship_keywords = [k.lower() for k in self.config.get('internship_keywords', [])]
-        self.include_title = [k.lower() for k in self.config.get('include_title', [])]
-        self.exclude_title = [k.lower() for k in self.config.get('exclude_title', [])]
-        self.include_description = [k.lower() for k in self.config.get('include_description', [])]
+        self.internship_keywords = list(self.config.get('internship_keywords', ()))
+        self.include_title = list(self.config.get('include_title', ()))
+        self.exclude_title = list(self.config.get('exclude_title', ()))
+        self.include_description = list(self.config.get('include_description', ()))
         self.minimum_score = self.config.get('minimum_match_score', 3)
 
+        # The title side of the internship check rides on the title automaton below;
+        # the description side only needs a yes/no, so a regex alternation that stops
+        # at the first hit is enough. No word boundaries: 'intern' must still match 'interns'
+        self._internship_keyword_set = frozenset(self.internship_keywords)
+        self._internship_description_re = self._compile_union(self.internship_keywords[:3])
+
+        # Keyword -> position in its bucket; the keys double as a set for intersecting hits
+        self._include_title_rank = self._rank(self.include_title)
+        self._exclude_title_rank = self._rank(self.exclude_title)
+        self._include_description_rank = self._rank(self.include_description)
+
+        # Build each automaton once so every job is scanned in a single linear pass
+        self._title_matcher = _KeywordMatcher(self.internship_keywords + self.include_title + self.exclude_title)
+        self._description_matcher = _KeywordMatcher(self.include_description)
+
         logger.info(f"Keyword filter initialized (min score: {self.minimum_score})")
 
+    @staticmethod
+    def _compile_union(keywords: List[str]) -> re.Pattern:
+        """Compile keywords into one alternation that matches any of them as a substring"""
+        if not keywords:
+            return re.compile(r'(?!)')  # Never matches
+        return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+    @staticmethod
+    def _rank(keywords: List[str]) -> Dict[str, int]:
+        """Map each keyword to its first position in the config list"""
+        rank = {}
+        for keyword in keywords:
+            rank.setdefault(keyword, len(rank))
+        return rank
+
+    def _title_score(self, title_hits: Set[str]) -> int:
+        """Score the title buckets (includes and exclusions) from match counts"""
+        return (
+            self.WEIGHTS['title_matches'] * len(title_hits & self._include_title_rank.keys())
+            + self.WEIGHTS['title_excludes'] * len(title_hits & self._exclude_title_rank.keys())
+        )
+
+    def _score_hits(self, title_hits: Set[str], description_hits: Set[str]) -> int:
+        """Score matched keywords from bucket counts alone, without building a breakdown"""
+        return (
+            self._title_score(title_hits)
+            + self.WEIGHTS['description_matches'] * len(description_hits & self._include_description_rank.keys())
+        )
+
+    def _build_breakdown(self, title_hits: Set[str], description_hits: Set[str], score: int) -> Dict:
+        """Attribute matched keywords to their buckets, in config order"""
+        return {
+            # Title matching (weighted +3)
+            'title_matches': self._bucket_hits(title_hits, self._include_title_rank),
+            # Title exclusions (heavy penalty -10)
+            'title_excludes': self._bucket_hits(title_hits, self._exclude_title_rank),
+            # Description matching (+1 each)
+            'description_matches': self._bucket_hits(description_hits, self._include_description_rank),
+            'total_score': score
+        }
+
+    @staticmethod
+    def _bucket_hits(hits: Set[str], rank: Dict[str, int]) -> List[str]:
+        """Intersect matched keywords with a bucket, keeping config order"""
+        return sorted(hits & rank.keys(), key=rank.__getitem__)
+
+    @staticmethod
+    def _lowercase_text(job: Dict) -> Tuple[str, str]:
+        """Return the lowercased (title, description) of a job"""
+        return str(job.get('title', '')).lower(), str(job.get('description', '')).lower()
+
     def is_internship(self, job: Dict) -> bool:
         """
         Check if job is an internship
@@ -45,20 +175,17 @@ class KeywordFilter:
         Returns:
             True if job appears to be an internship
         """
-        title = str(job.get('title', '')).lower()
-        description = str(job.get('description', '')).lower()
-
-        # Check title first (most reliable)
-        for keyword in self.internship_keywords:
-            if keyword in title:
-                return True
-
-        # Check description as fallback
-        for keyword in self.internship_keywords[:3]:  # Only check intern/internship/co-op in description
-            if keyword in description[:500]:  # Only check first 500 chars
-                return True
-
-        return False
+        title, description = self._lowercase_text(job)
+        return self._is_internship(self._title_matcher.find(title), description)
+
+    def _is_internship(self, title_hits: Set[str], description: str) -> bool:
+        """Internship check on the title's keyword hits and the lowercased description"""
+        # Check title first (most reliable), then fall back to the description
+        # Only check intern/internship/co-op in the first 500 chars of the description
+        return bool(
+            not self._internship_keyword_set.isdisjoint(title_hits)
+            or self._internship_description_re.search(description, 0, 500)
+        )
 
     def calculate_relevance_score(self, job: Dict) -> Tuple[int, Dict]:
         """
@@ -70,39 +197,17 @@ class KeywordFilter:
         Returns:
             Tuple of (score, breakdown) where breakdown shows how score was calculated
         """
-        title = str(job.get('title', '')).lower()
-        description = str(job.get('description', '')).lower()
-
-        breakdown = {
-            'title_matches': [],
-            'title_excludes': [],
-            'description_matches': [],
-            'total_score': 0
-        }
-
-        score = 0
-
-        # Title matching (weighted +3)
-        for keyword in self.include_title:
-            if keyword in title:
-                score += 3
-                breakdown['title_matches'].append(keyword)
-
-        # Title exclusions (heavy penalty -10)
-        for keyword in self.exclude_title:
-            if keyword in title:
-                score -= 10
-                breakdown['title_excludes'].append(keyword)
+        return self._calculate_relevance_score(*self._lowercase_text(job))
 
-        # Description matching (+1 each)
-        for keyword in self.include_description:
-            if keyword in description:
-                score += 1
-                breakdown['description_matches'].append(keyword)
+    def _calculate_relevance_score(self, title: str, description: str) -> Tuple[int, Dict]:
+        """Relevance scoring on already-lowercased title and description"""
+        # One pass per text; keywords are attributed to their bucket in config order
+        title_hits = self._title_matcher.find(title)
+        description_hits = self._description_matcher.find(description)
 
-        breakdown['total_score'] = score
+        score = self._score_hits(title_hits, description_hits)
 
-        return score, breakdown
+        return score, self._build_breakdown(title_hits, description_hits, score)
 
     def is_relevant(self, job: Dict) -> bool:
         """
@@ -117,13 +222,14 @@ class KeywordFilter:
         score, _ = self.calculate_relevance_score(job)
         return score >= self.minimum_score
 
-    def filter_jobs(self, jobs: List[Dict], require_internship: bool = True) -> List[Dict]:
+    def filter_jobs(self, jobs: List[Dict], require_internship: bool = True, top_k: int = None) -> List[Dict]:
         """
         Filter jobs based on relevance and internship status
 
         Args:
             jobs: List of job dictionaries
             require_internship: If True, only return internships
+            top_k: If set, only return the top_k highest scoring jobs
 
         Returns:
             Filtered list of relevant jobs with scores attached
@@ -131,21 +237,32 @@ class KeywordFilter:
         filtered_jobs = []
 
         for job in jobs:
+            # Lowercase once per job and share it between both checks
+            title, description = self._lowercase_text(job)
+
+            # One title pass serves both the internship check and scoring
+            title_hits = self._title_matcher.find(title)
+
             # Check if internship (if required)
-            if require_internship and not self.is_internship(job):
+            if require_internship and not self._is_internship(title_hits, description):
                 continue
 
-            # Calculate relevance score
-            score, breakdown = self.calculate_relevance_score(job)
+            # Calculate relevance score from match counts only
+            description_hits = self._description_matcher.find(description)
+            score = self._score_hits(title_hits, description_hits)
 
             # Check if meets minimum threshold
             if score >= self.minimum_score:
-                # Attach score and breakdown to job
+                # Attach score and breakdown to job - only kept jobs pay for the breakdown
                 job['relevance_score'] = score
-                job['score_breakdown'] = breakdown
+                job['score_breakdown'] = self._build_breakdown(title_hits, description_hits, score)
                 filtered_jobs.append(job)
 
-        logger.info(f"Filtered {len(jobs)} jobs → {len(filtered_jobs)} relevant UI/UX internships")
+        logger.info("Filtered %d jobs → %d relevant UI/UX internships", len(jobs), len(filtered_jobs))
+
+        # Only the best top_k are needed - a heap avoids sorting the whole list
+        if top_k is not None:
+            return heapq.nlargest(top_k, filtered_jobs, key=lambda x: x['relevance_score'])
 
         # Sort by relevance score (highest first)
         filtered_jobs.sort(key=lambda x: x['relevance_score'], reverse=True)
@@ -170,19 +287,18 @@ class KeywordFilter:
                 'top_keywords': {}
             }
 
-        scores = [j['relevance_score'] for j in jobs]
-
-        # Count top keywords
-        keyword_counts = {}
+        # Collect scores and count top keywords in a single walk over the jobs
+        scores = []
+        keyword_counts = Counter()
         for job in jobs:
-            for keyword in job.get('score_breakdown', {}).get('title_matches', []):
-                keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
+            scores.append(job['relevance_score'])
+            keyword_counts.update(job.get('score_breakdown', {}).get('title_matches', ()))
 
         return {
             'total': len(jobs),
             'average_score': sum(scores) / len(scores),
             'score_range': (min(scores), max(scores)),
-            'top_keywords': dict(sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:10])
+            'top_keywords': dict(keyword_counts.most_common(10))
         }
 
 
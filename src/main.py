@@ -6,18 +6,29 @@ Coordinates all scrapers, filtering, deduplication, and output generation
 
 import os
 import sys
-import json
 import yaml
+import orjson
 import logging
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    # Use libyaml's C loader when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Resolve source and project directories once at import
+_SRC_DIR = Path(__file__).resolve().parent
+_PROJECT_ROOT = _SRC_DIR.parent
 
 # Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(_SRC_DIR))
+
+# Load environment variables from .env file before the config snapshot is taken
+load_dotenv()
 
 from scrapers.greenhouse_scraper import GreenhouseScraper
 from scrapers.lever_scraper import LeverScraper
@@ -57,7 +68,7 @@ class InternshipScraper:
         """
         if project_root is None:
             # Assume we're in src/, go up one level
-            project_root = Path(__file__).parent.parent
+            project_root = _PROJECT_ROOT
 
         self.project_root = project_root
         self.data_dir = project_root / 'data'
@@ -99,7 +110,7 @@ class InternshipScraper:
         """Load company list from YAML"""
         try:
             with open(self.companies_file, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
                 return data.get('companies', [])
         except FileNotFoundError:
             logger.error(f"Companies file not found: {self.companies_file}")
@@ -109,6 +120,10 @@ class InternshipScraper:
         """
         Scrape jobs from all sources
 
+        Sources are independent and network-bound, so they are fetched
+        concurrently. Results are merged in the fixed source order below so
+        the output (and deduplication tie-breaks) stay deterministic.
+
         Returns:
             List of all jobs from all sources
         """
@@ -118,83 +133,62 @@ class InternshipScraper:
         logger.info("PHASE 1: Scraping Jobs from All Sources")
         logger.info("="*80)
 
-        # 1. Greenhouse (company-specific)
-        logger.info("\n[1/12] Scraping Greenhouse...")
-        greenhouse_jobs = self.greenhouse.fetch_multiple_companies(self.companies)
-        logger.info(f"  → Found {len(greenhouse_jobs)} jobs from Greenhouse")
-        all_jobs.extend(greenhouse_jobs)
-
-        # 2. Lever (company-specific)
-        logger.info("\n[2/12] Scraping Lever...")
-        lever_jobs = self.lever.fetch_multiple_companies(self.companies)
-        logger.info(f"  → Found {len(lever_jobs)} jobs from Lever")
-        all_jobs.extend(lever_jobs)
-
-        # 3. Ashby (company-specific)
-        logger.info("\n[3/12] Scraping Ashby...")
-        ashby_jobs = self.ashby.fetch_multiple_companies(self.companies)
-        logger.info(f"  → Found {len(ashby_jobs)} jobs from Ashby")
-        all_jobs.extend(ashby_jobs)
-
-        # 4. Workable (company-specific)
-        logger.info("\n[4/12] Scraping Workable...")
-        workable_jobs = self.workable.fetch_multiple_companies(self.companies)
-        logger.info(f"  → Found {len(workable_jobs)} jobs from Workable")
-        all_jobs.extend(workable_jobs)
-
-        # 5. RemoteOK (general job board)
-        logger.info("\n[5/12] Scraping RemoteOK...")
-        remoteok_jobs = self.remoteok.fetch_jobs(search_tag='design')
-        logger.info(f"  → Found {len(remoteok_jobs)} design jobs from RemoteOK")
-        all_jobs.extend(remoteok_jobs)
-
-        # 6. The Muse (internship-focused)
-        logger.info("\n[6/12] Scraping The Muse...")
-        themuse_jobs = self.themuse.fetch_jobs(category='Design', level='Internship')
-        logger.info(f"  → Found {len(themuse_jobs)} design internships from The Muse")
-        all_jobs.extend(themuse_jobs)
-
-        # 7. Adzuna (broad coverage)
-        logger.info("\n[7/12] Scraping Adzuna...")
-        adzuna_jobs = self.adzuna.fetch_jobs(query='UI UX design intern')
-        logger.info(f"  → Found {len(adzuna_jobs)} jobs from Adzuna")
-        all_jobs.extend(adzuna_jobs)
-
-        # 8. Jooble (internship category)
-        logger.info("\n[8/12] Scraping Jooble...")
-        jooble_jobs = self.jooble.fetch_jobs(keywords='UI UX design intern')
-        logger.info(f"  → Found {len(jooble_jobs)} jobs from Jooble")
-        all_jobs.extend(jooble_jobs)
-
-        # 9. Y Combinator (startup job board)
-        logger.info("\n[9/12] Scraping Y Combinator...")
-        yc_jobs = self.ycombinator.fetch_jobs()
-        logger.info(f"  → Found {len(yc_jobs)} startup internships from YC")
-        all_jobs.extend(yc_jobs)
-
-        # 10. JobSpy (Indeed, Glassdoor, LinkedIn) - Multi-term search
-        logger.info("\n[10/12] Scraping with JobSpy (Indeed, Glassdoor, LinkedIn)...")
-        jobspy_jobs = self.jobspy.fetch_jobs(
-            search_terms=['UX intern', 'UI intern', 'design intern'],  # Multi-term for maximum coverage
-            location='United States',
-            results_wanted=100  # Per site per term, optimized from experiments
-        )
-        logger.info(f"  → Found {len(jobspy_jobs)} jobs from JobSpy")
-        all_jobs.extend(jobspy_jobs)
-
-        # 11. Hacker News "Who is Hiring?"
-        logger.info("\n[11/12] Scraping Hacker News...")
-        hn_jobs = self.hackernews.fetch_jobs()
-        logger.info(f"  → Found {len(hn_jobs)} startup jobs from Hacker News")
-        all_jobs.extend(hn_jobs)
-
-        # 12. RSS Feeds (We Work Remotely, Remotive, Himalayas, Jobicy)
-        logger.info("\n[12/12] Scraping RSS Feeds...")
-        rss_jobs = self.rss.fetch_jobs()
-        logger.info(f"  → Found {len(rss_jobs)} jobs from RSS feeds")
-        all_jobs.extend(rss_jobs)
-
-        logger.info(f"\n✓ Total jobs scraped: {len(all_jobs)}")
+        # (log label, fetch callable, description used in the result log line)
+        sources = [
+            # 1. Greenhouse (company-specific)
+            ('Greenhouse', lambda: self.greenhouse.fetch_multiple_companies(self.companies),
+             'jobs from Greenhouse'),
+            # 2. Lever (company-specific)
+            ('Lever', lambda: self.lever.fetch_multiple_companies(self.companies),
+             'jobs from Lever'),
+            # 3. Ashby (company-specific)
+            ('Ashby', lambda: self.ashby.fetch_multiple_companies(self.companies),
+             'jobs from Ashby'),
+            # 4. Workable (company-specific)
+            ('Workable', lambda: self.workable.fetch_multiple_companies(self.companies),
+             'jobs from Workable'),
+            # 5. RemoteOK (general job board)
+            ('RemoteOK', lambda: self.remoteok.fetch_jobs(search_tag='design'),
+             'design jobs from RemoteOK'),
+            # 6. The Muse (internship-focused)
+            ('The Muse', lambda: self.themuse.fetch_jobs(category='Design', level='Internship'),
+             'design internships from The Muse'),
+            # 7. Adzuna (broad coverage)
+            ('Adzuna', lambda: self.adzuna.fetch_jobs(query='UI UX design intern'),
+             'jobs from Adzuna'),
+            # 8. Jooble (internship category)
+            ('Jooble', lambda: self.jooble.fetch_jobs(keywords='UI UX design intern'),
+             'jobs from Jooble'),
+            # 9. Y Combinator (startup job board)
+            ('Y Combinator', lambda: self.ycombinator.fetch_jobs(),
+             'startup internships from YC'),
+            # 10. JobSpy (Indeed, Glassdoor, LinkedIn) - Multi-term search
+            ('with JobSpy (Indeed, Glassdoor, LinkedIn)', lambda: self.jobspy.fetch_jobs(
+                search_terms=['UX intern', 'UI intern', 'design intern'],  # Multi-term for maximum coverage
+                location='United States',
+                results_wanted=100  # Per site per term, optimized from experiments
+            ), 'jobs from JobSpy'),
+            # 11. Hacker News "Who is Hiring?"
+            ('Hacker News', lambda: self.hackernews.fetch_jobs(),
+             'startup jobs from Hacker News'),
+            # 12. RSS Feeds (We Work Remotely, Remotive, Himalayas, Jobicy)
+            ('RSS Feeds', lambda: self.rss.fetch_jobs(),
+             'jobs from RSS feeds'),
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = []
+            for i, (label, fetch, _) in enumerate(sources, 1):
+                logger.info("\n[%d/%d] Scraping %s...", i, len(sources), label)
+                futures.append(executor.submit(fetch))
+
+            # Collect in source order; each result waits only on its own scraper
+            for (_, _, found), future in zip(sources, futures):
+                jobs = future.result()
+                logger.info("  → Found %d %s", len(jobs), found)
+                all_jobs.extend(jobs)
+
+        logger.info("\n✓ Total jobs scraped: %d", len(all_jobs))
 
         return all_jobs
 
@@ -214,13 +208,13 @@ class InternshipScraper:
 
         filtered_jobs = self.filter.filter_jobs(jobs, require_internship=True)
 
-        logger.info(f"✓ {len(jobs)} total jobs → {len(filtered_jobs)} relevant UI/UX internships")
+        logger.info("✓ %d total jobs → %d relevant UI/UX internships", len(jobs), len(filtered_jobs))
 
         # Show statistics
         stats = self.filter.get_statistics(filtered_jobs)
         if stats['total'] > 0:
-            logger.info(f"  Average relevance score: {stats['average_score']:.2f}")
-            logger.info(f"  Score range: {stats['score_range'][0]} - {stats['score_range'][1]}")
+            logger.info("  Average relevance score: %.2f", stats['average_score'])
+            logger.info("  Score range: %s - %s", *stats['score_range'])
 
         return filtered_jobs
 
@@ -245,15 +239,27 @@ class InternshipScraper:
         return unique_jobs
 
     def save_jobs_cache(self, jobs: list):
-        """Save jobs to JSON cache file"""
-        cache_data = {
-            'last_updated': datetime.now().isoformat(),
-            'total_jobs': len(jobs),
-            'jobs': jobs
-        }
+        """
+        Save jobs to JSON cache file
 
-        with open(self.jobs_cache_file, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+        The file stays a single JSON document, but is laid out one record per line:
+        the header (last_updated, total_jobs) opens the first line, then each job is
+        a compact object on its own line. Readers can stream it line by line and git
+        diffs stay line-oriented.
+        """
+        header = orjson.dumps({
+            'last_updated': datetime.now().isoformat(),
+            'total_jobs': len(jobs)
+        })
+
+        # orjson encodes straight to bytes; NaN values (from pandas) are written as null
+        with open(self.jobs_cache_file, 'wb') as f:
+            f.write(header[:-1] + b',"jobs":[\n')
+            last = len(jobs) - 1
+            for i, job in enumerate(jobs):
+                f.write(orjson.dumps(job, option=orjson.OPT_SERIALIZE_NUMPY))
+                f.write(b',\n' if i < last else b'\n')
+            f.write(b']}\n')
 
         logger.info(f"✓ Saved {len(jobs)} jobs to {self.jobs_cache_file}")
 
@@ -263,11 +269,13 @@ class InternshipScraper:
         logger.info("PHASE 4: Generating README")
         logger.info("="*80)
 
-        readme_content = self.markdown.generate_readme(jobs)
-
+        # Stream the markdown into a temp file and swap it in, so a failure midway
+        # leaves the previous README intact
         readme_path = self.project_root / 'README.md'
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
+        tmp_path = readme_path.with_name(readme_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            self.markdown.write_readme(jobs, f)
+        os.replace(tmp_path, readme_path)
 
         logger.info(f"✓ Generated README with {len(jobs)} internships")
         logger.info(f"  Saved to: {readme_path}")
@@ -290,12 +298,18 @@ class InternshipScraper:
             # Step 2: Filter for relevance
             filtered_jobs = self.filter_jobs(all_jobs)
 
+            # Only the counts are needed from here on; let the unfiltered jobs go
+            scraped_count = len(all_jobs)
+            del all_jobs
+
             if not filtered_jobs:
                 logger.warning("⚠ No relevant UI/UX internships found after filtering!")
                 return
 
             # Step 3: Deduplicate
             unique_jobs = self.deduplicate_jobs(filtered_jobs)
+            filtered_count = len(filtered_jobs)
+            del filtered_jobs
 
             # Step 4: Save cache
             self.save_jobs_cache(unique_jobs)
@@ -307,8 +321,8 @@ class InternshipScraper:
             logger.info("\n" + "="*80)
             logger.info("COMPLETE!")
             logger.info("="*80)
-            logger.info(f"✓ {len(all_jobs)} jobs scraped")
-            logger.info(f"✓ {len(filtered_jobs)} relevant internships")
+            logger.info(f"✓ {scraped_count} jobs scraped")
+            logger.info(f"✓ {filtered_count} relevant internships")
             logger.info(f"✓ {len(unique_jobs)} unique listings")
             logger.info(f"✓ README.md updated")
             logger.info(f"\nFinished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -3,12 +3,14 @@ Adzuna scraper - Broad coverage job aggregator
 Free tier: 1,000 calls/month (requires app ID and key)
 """
 
-import os
 import requests
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from config import CONFIG, Config
+from .http_cache import cached_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,21 +19,24 @@ class AdzunaScraper:
 
     BASE_URL = "https://api.adzuna.com/v1/api/jobs/us/search/{page}"
 
-    def __init__(self, app_id: str = None, app_key: str = None):
+    def __init__(self, app_id: str = None, app_key: str = None, config: Config = CONFIG):
         """
         Initialize scraper with Adzuna credentials
 
         Args:
-            app_id: Adzuna app ID. If None, reads from ADZUNA_APP_ID env var
-            app_key: Adzuna app key. If None, reads from ADZUNA_APP_KEY env var
+            app_id: Adzuna app ID. If None, uses config.adzuna_app_id (ADZUNA_APP_ID)
+            app_key: Adzuna app key. If None, uses config.adzuna_app_key (ADZUNA_APP_KEY)
+            config: Runtime configuration (defaults to the environment)
         """
-        self.app_id = app_id or os.getenv('ADZUNA_APP_ID')
-        self.app_key = app_key or os.getenv('ADZUNA_APP_KEY')
+        self.app_id = app_id or config.adzuna_app_id
+        self.app_key = app_key or config.adzuna_app_key
 
         if not self.app_id or not self.app_key:
             logger.warning("Adzuna credentials not provided - skipping this source")
 
-        self.session = requests.Session()
+        # Identical queries within the TTL are served from disk and don't count
+        # against the API quota; credentials are kept out of the cache
+        self.session = cached_session('adzuna', ignored_parameters=['app_id', 'app_key'])
         self.session.headers.update({
             'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project)'
         })
@@ -61,37 +66,60 @@ class AdzunaScraper:
 
         all_jobs = []
         max_pages = 2  # Limit to 2 pages (100 jobs) to conserve API quota
+        page_size = params['results_per_page']
 
         try:
+            seen_ids = set()
+            fetched = 0
             for page in range(1, max_pages + 1):
-                url = self.BASE_URL.format(page=page)
-
-                response = self.session.get(url, params=params, timeout=10)
-                response.raise_for_status()
+                try:
+                    data = self._fetch_page(page, params)
+                except requests.exceptions.RequestException as e:
+                    if page == 1:
+                        raise
+                    # Keep the pages we already have rather than dropping them all
+                    logger.warning(f"⚠ Adzuna: Page {page} failed, keeping earlier pages: {str(e)}")
+                    break
 
-                data = response.json()
                 results = data.get('results', [])
 
                 if not results:
                     break  # No more results
 
-                all_jobs.extend(results)
+                # Listings can shift between pages; keep the first copy of each id
+                for job in results:
+                    job_id = job.get('id')
+                    if job_id in seen_ids:
+                        continue
+                    seen_ids.add(job_id)
+                    all_jobs.append(job)
+                fetched += len(results)
 
-                # Check if we've reached the end
+                # Only spend another call when this page was full and more remain
                 count = data.get('count', 0)
-                if len(all_jobs) >= count:
+                if len(results) < page_size or fetched >= count:
                     break
 
             logger.info(f"✓ Adzuna: {len(all_jobs)} jobs found for '{query}'")
 
             # Convert to standardized format
-            return [self._normalize_job(job) for job in all_jobs]
+            now_iso = datetime.now().isoformat()
+            return [self._normalize_job(job, now_iso) for job in all_jobs]
 
         except requests.exceptions.RequestException as e:
             logger.error(f"✗ Adzuna: Request failed: {str(e)}")
             return []
 
-    def _normalize_job(self, job: Dict) -> Dict:
+    def _fetch_page(self, page: int, params: Dict) -> Dict:
+        """Fetch a single results page from Adzuna"""
+        url = self.BASE_URL.format(page=page)
+
+        response = self.session.get(url, params=params, timeout=10)
+        response.raise_for_status()
+
+        return response.json()
+
+    def _normalize_job(self, job: Dict, now_iso: str) -> Dict:
         """Convert Adzuna job format to standardized format"""
 
         # Extract company
@@ -108,7 +136,7 @@ class AdzunaScraper:
             location = 'Remote'
 
         # Extract date (Adzuna uses ISO format)
-        created = job.get('created', datetime.now().isoformat())
+        created = job.get('created') or now_iso
 
         # Build redirect URL (Adzuna uses redirects)
         job_url = job.get('redirect_url', '')
@@ -128,17 +156,19 @@ class AdzunaScraper:
             'source': 'Adzuna',
             'salary_min': salary_min,
             'salary_max': salary_max,
-            'contract_type': job.get('contract_type'),
-            'raw_data': job
+            'contract_type': job.get('contract_type')
         }
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.adzuna_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
-    # Test with credentials from environment
-    scraper = AdzunaScraper()
+    # Test with credentials from environment (or .env file)
+    from dotenv import load_dotenv
+    load_dotenv()
+    scraper = AdzunaScraper(config=Config.from_env())
 
     if scraper.app_id and scraper.app_key:
         # Fetch UI/UX design internships
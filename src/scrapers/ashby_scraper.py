@@ -3,21 +3,34 @@ Ashby scraper - No authentication required for public job boards
 Used by: Notion, OpenAI, Anthropic, Scale AI, Ramp, Linear (modern design-focused companies!)
 """
 
+import orjson
 import requests
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from .http_session import TIMEOUT, fetch_boards, revalidating_session
+
 logger = logging.getLogger(__name__)
 
 
+def _name_of(value, default: str):
+    """Ashby fields are either a plain string or a {'name': ...} object"""
+    value_type = type(value)
+    if value_type is dict:
+        return value.get('name', default)
+    if value_type is str:
+        return value
+    return default
+
+
 class AshbyScraper:
     """Scraper for Ashby ATS public API"""
 
     BASE_URL = "https://api.ashbyhq.com/posting-api/job-board/{company}"
 
     def __init__(self):
-        self.session = requests.Session()
+        self.session = revalidating_session('ashby')
         self.session.headers.update({
             'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project)'
         })
@@ -36,16 +49,18 @@ class AshbyScraper:
         url = self.BASE_URL.format(company=company_handle)
 
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, timeout=TIMEOUT)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             jobs = data.get('jobs', [])
 
             logger.info(f"✓ Ashby: {company_name} - {len(jobs)} jobs found")
 
-            # Convert to standardized format
-            return [self._normalize_job(job, company_name) for job in jobs]
+            # Convert to standardized format (fallback URL slug is the same for every job)
+            company_slug = company_name.lower().replace(' ', '-')
+            now_iso = datetime.now().isoformat()
+            return [self._normalize_job(job, company_name, company_slug, now_iso) for job in jobs]
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -58,36 +73,25 @@ class AshbyScraper:
             logger.error(f"✗ Ashby: {company_name} - Request failed: {str(e)}")
             return []
 
-    def _normalize_job(self, job: Dict, company_name: str) -> Dict:
+        except orjson.JSONDecodeError as e:
+            logger.error(f"✗ Ashby: {company_name} - Invalid JSON response: {str(e)}")
+            return []
+
+    def _normalize_job(self, job: Dict, company_name: str, company_slug: str, now_iso: str) -> Dict:
         """Convert Ashby job format to standardized format"""
 
         # Extract location (handle both string and dict formats)
-        location_raw = job.get('location', 'Remote')
-        if isinstance(location_raw, dict):
-            location = location_raw.get('name', 'Remote')
-        elif isinstance(location_raw, str):
-            location = location_raw
-        else:
-            location = 'Remote'
-
-        if not location:
-            location = 'Remote'
+        location = _name_of(job.get('location', 'Remote'), 'Remote') or 'Remote'
 
         # Extract department/team (handle both string and dict formats)
-        department_raw = job.get('department', '')
-        if isinstance(department_raw, dict):
-            department = department_raw.get('name', '')
-        elif isinstance(department_raw, str):
-            department = department_raw
-        else:
-            department = ''
+        department = _name_of(job.get('department', ''), '')
 
         # Get job description
         description = job.get('descriptionHtml', '') or job.get('description', '')
 
         # Build job URL
         job_id = job.get('id', '')
-        job_url = f"https://jobs.ashbyhq.com/{company_name.lower().replace(' ', '-')}/{job_id}"
+        job_url = f"https://jobs.ashbyhq.com/{company_slug}/{job_id}"
         if 'jobUrl' in job:
             job_url = job['jobUrl']
 
@@ -98,11 +102,10 @@ class AshbyScraper:
             'location': location,
             'url': job_url,
             'description': description,
-            'posted_date': job.get('publishedDate', datetime.now().isoformat()),
+            'posted_date': job.get('publishedDate') or now_iso,
             'source': 'Ashby',
             'department': department,
-            'employment_type': job.get('employmentType', ''),
-            'raw_data': job
+            'employment_type': job.get('employmentType', '')
         }
 
     def fetch_multiple_companies(self, companies: List[Dict]) -> List[Dict]:
@@ -115,23 +118,15 @@ class AshbyScraper:
         Returns:
             Combined list of all jobs from all companies
         """
-        all_jobs = []
-
         ashby_companies = [c for c in companies if 'ashby' in c]
         logger.info(f"Fetching from {len(ashby_companies)} Ashby companies...")
 
-        for company in ashby_companies:
-            jobs = self.fetch_company_jobs(
-                company_handle=company['ashby'],
-                company_name=company['name']
-            )
-            all_jobs.extend(jobs)
-
-        return all_jobs
+        return fetch_boards(self.fetch_company_jobs, ashby_companies, 'ashby')
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.ashby_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
     scraper = AshbyScraper()
@@ -3,11 +3,14 @@ Greenhouse scraper - No authentication required for public job boards
 Used by: Airbnb, Spotify, Pinterest, Figma, Stripe, and many more
 """
 
+import orjson
 import requests
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from .http_session import TIMEOUT, fetch_boards, revalidating_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,7 +20,7 @@ class GreenhouseScraper:
     BASE_URL = "https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
 
     def __init__(self):
-        self.session = requests.Session()
+        self.session = revalidating_session('greenhouse')
         self.session.headers.update({
             'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project)'
         })
@@ -36,16 +39,17 @@ class GreenhouseScraper:
         url = self.BASE_URL.format(company=company_handle)
 
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, timeout=TIMEOUT)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             jobs = data.get('jobs', [])
 
             logger.info(f"✓ Greenhouse: {company_name} - {len(jobs)} jobs found")
 
             # Convert to standardized format
-            return [self._normalize_job(job, company_name) for job in jobs]
+            now_iso = datetime.now().isoformat()
+            return [self._normalize_job(job, company_name, now_iso) for job in jobs]
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -58,7 +62,11 @@ class GreenhouseScraper:
             logger.error(f"✗ Greenhouse: {company_name} - Request failed: {str(e)}")
             return []
 
-    def _normalize_job(self, job: Dict, company_name: str) -> Dict:
+        except orjson.JSONDecodeError as e:
+            logger.error(f"✗ Greenhouse: {company_name} - Invalid JSON response: {str(e)}")
+            return []
+
+    def _normalize_job(self, job: Dict, company_name: str, now_iso: str) -> Dict:
         """Convert Greenhouse job format to standardized format"""
 
         # Extract location
@@ -74,10 +82,9 @@ class GreenhouseScraper:
             'location': location,
             'url': job.get('absolute_url', ''),
             'description': job.get('content', ''),
-            'posted_date': job.get('updated_at', datetime.now().isoformat()),
+            'posted_date': job.get('updated_at') or now_iso,
             'source': 'Greenhouse',
-            'departments': departments,
-            'raw_data': job
+            'departments': departments
         }
 
     def fetch_multiple_companies(self, companies: List[Dict]) -> List[Dict]:
@@ -90,23 +97,15 @@ class GreenhouseScraper:
         Returns:
             Combined list of all jobs from all companies
         """
-        all_jobs = []
-
         greenhouse_companies = [c for c in companies if 'greenhouse' in c]
         logger.info(f"Fetching from {len(greenhouse_companies)} Greenhouse companies...")
 
-        for company in greenhouse_companies:
-            jobs = self.fetch_company_jobs(
-                company_handle=company['greenhouse'],
-                company_name=company['name']
-            )
-            all_jobs.extend(jobs)
-
-        return all_jobs
+        return fetch_boards(self.fetch_company_jobs, greenhouse_companies, 'greenhouse')
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.greenhouse_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
     scraper = GreenhouseScraper()
@@ -4,12 +4,23 @@ Scrapes monthly job threads from Hacker News for design/UX internships
 API: Algolia HN Search (https://hn.algolia.com/api)
 """
 
-import requests
+import html
+import json
 import logging
 import re
+import orjson
 from typing import List, Dict
 from datetime import datetime
 
+from .http_cache import CACHE_DIR, cached_session
+from .http_session import configure_session
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is a C extension; fall back to the keyword regexes without it
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,9 +31,64 @@ class HackerNewsScraper:
     ALGOLIA_ITEM_URL = "https://hn.algolia.com/api/v1/items"
     HN_ITEM_URL = "https://news.ycombinator.com/item"
 
+    # Thread comments change slowly; reuse fetched items for this long (seconds)
+    CACHE_TTL = 6 * 3600
+
+    # Resolved thread id per month, e.g. {"October 2026": "45436449"}
+    THREAD_CACHE_FILE = CACHE_DIR / 'hn_thread.json'
+
+    # Keyword checks are plain substring matches on lowercased text, so each list is
+    # folded into one alternation and the text is scanned once instead of per keyword
+    DESIGN_KEYWORDS = [
+        'design', 'ux', 'ui', 'user experience', 'user interface',
+        'product design', 'visual design', 'interaction design',
+        'figma', 'sketch', 'adobe xd'
+    ]
+    INTERNSHIP_KEYWORDS = [
+        'intern', 'internship', 'co-op', 'co op',
+        'summer 2025', 'summer 2026', 'fall 2025', 'spring 2026'
+    ]
+    _DESIGN_RE = re.compile('|'.join(map(re.escape, DESIGN_KEYWORDS)))
+    _INTERNSHIP_RE = re.compile('|'.join(map(re.escape, INTERNSHIP_KEYWORDS)))
+
+    # Extraction patterns, compiled once
+    _TAG_RE = re.compile(r'<[^>]+>')
+    _HIRING_RE = re.compile(r'^([A-Z][A-Za-z0-9\s&.-]+)\s+(?:is|are)\s+hiring', re.MULTILINE)
+    _COMPANY_LABEL_RE = re.compile(r'Company:\s*([^\n]+)', re.IGNORECASE)
+    # Tried in priority order - an earlier pattern wins even if a later one matches
+    # further left, so these stay separate searches rather than one alternation
+    _LOCATION_PATTERNS = [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r'Location:\s*([^\n]+)',
+            r'\|\s*([A-Z][a-z]+(?:,\s*[A-Z]{2})?)\s*\|',  # | City, ST |
+            r'(?:Remote|REMOTE)',
+            r'\b([A-Z][a-z]+,\s*(?:CA|NY|TX|MA|WA|OR|CO))\b',  # City, State
+        )
+    ]
+    _TITLE_PATTERNS = [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r'(?:Product|UX|UI|User Experience|Visual|Interaction)\s+(?:Design|Designer)\s+Intern',
+            r'Design\s+Intern',
+            r'Intern[:\-\s]+(?:Product|UX|UI|Design)',
+        )
+    ]
+
     def __init__(self):
         """Initialize Hacker News scraper"""
-        self.session = requests.Session()
+        # One automaton over both keyword lists, each keyword tagged with its list
+        self._keyword_automaton = None
+        if ahocorasick is not None:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for keyword in self.DESIGN_KEYWORDS:
+                self._keyword_automaton.add_word(keyword, 'design')
+            for keyword in self.INTERNSHIP_KEYWORDS:
+                # Keywords in both lists would be overwritten; none overlap today
+                self._keyword_automaton.add_word(keyword, 'internship')
+            self._keyword_automaton.make_automaton()
+
+        # Search and item responses are cached on disk for CACHE_TTL; pooled
+        # keep-alive connections retry on 429/5xx
+        self.session = configure_session(cached_session('hackernews', expire_after=self.CACHE_TTL))
         self.session.headers.update({
             'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project)'
         })
@@ -64,6 +130,12 @@ class HackerNewsScraper:
 
     def _find_latest_hiring_thread(self) -> str:
         """Find the most recent 'Who is Hiring?' thread"""
+        # A month has one thread, so once this month's is known skip the search
+        month = datetime.now().strftime('%B %Y')
+        thread_cache = self._load_thread_cache()
+        if month in thread_cache:
+            return thread_cache[month]
+
         try:
             params = {
                 'query': 'Ask HN: Who is hiring?',
@@ -84,7 +156,11 @@ class HackerNewsScraper:
                 title = hit.get('title', '').lower()
                 # Look for pattern like "ask hn: who is hiring? (month year)"
                 if 'who is hiring' in title and 'ask hn' in title:
-                    return hit.get('objectID')
+                    thread_id = hit.get('objectID')
+                    # Early in the month the latest thread may still be last month's
+                    if month.lower() in title:
+                        self._save_thread_cache({month: thread_id})
+                    return thread_id
 
             return None
 
@@ -92,17 +168,46 @@ class HackerNewsScraper:
             logger.error(f"Error finding hiring thread: {str(e)}")
             return None
 
+    def _load_thread_cache(self) -> Dict[str, str]:
+        """Read the month -> thread id cache (empty if missing or unreadable)"""
+        try:
+            with open(self.THREAD_CACHE_FILE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_thread_cache(self, thread_cache: Dict[str, str]) -> None:
+        """Persist the month -> thread id cache; caching is best-effort"""
+        try:
+            self.THREAD_CACHE_FILE.parent.mkdir(exist_ok=True)
+            with open(self.THREAD_CACHE_FILE, 'w') as f:
+                json.dump(thread_cache, f)
+        except OSError as e:
+            logger.debug(f"Could not save HN thread cache: {str(e)}")
+
     def _fetch_thread_comments(self, thread_id: str) -> List[Dict]:
-        """Fetch all top-level comments from a thread"""
+        """
+        Fetch all top-level comments from a thread
+
+        One Algolia item request returns the whole thread. Only the fields used
+        for parsing are kept from each top-level comment; the nested reply trees
+        under 'children' are dropped rather than carried through parsing.
+        """
         try:
             url = f"{self.ALGOLIA_ITEM_URL}/{thread_id}"
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Get top-level comments (direct children of the story)
-            children = data.get('children', [])
-            return children
+            return [
+                {
+                    'id': child.get('id'),
+                    'text': child.get('text', ''),
+                    'created_at': child.get('created_at')
+                }
+                for child in data.get('children', [])
+            ]
 
         except Exception as e:
             logger.error(f"Error fetching thread comments: {str(e)}")
@@ -115,6 +220,7 @@ class HackerNewsScraper:
         Each comment is a job posting in unstructured text format
         """
         jobs = []
+        now_iso = datetime.now().isoformat()
 
         for comment in comments:
             # Get comment text (HTML formatted)
@@ -122,51 +228,46 @@ class HackerNewsScraper:
             if not text:
                 continue
 
-            # Check if it's design/UX related
-            if not self._is_design_related(text):
-                continue
-
-            # Check if it mentions internship
-            if not self._is_internship(text):
+            # Must be both design/UX related and mention an internship
+            if not self._is_design_internship(text.lower()):
                 continue
 
             # Parse the job details
-            job = self._extract_job_details(comment, text)
+            job = self._extract_job_details(comment, text, now_iso)
             if job:
                 jobs.append(job)
 
         return jobs
 
-    def _is_design_related(self, text: str) -> bool:
-        """Check if comment mentions design/UX/UI"""
-        text_lower = text.lower()
-        design_keywords = [
-            'design', 'ux', 'ui', 'user experience', 'user interface',
-            'product design', 'visual design', 'interaction design',
-            'figma', 'sketch', 'adobe xd'
-        ]
-        return any(keyword in text_lower for keyword in design_keywords)
-
-    def _is_internship(self, text: str) -> bool:
-        """Check if comment mentions internship"""
-        text_lower = text.lower()
-        internship_keywords = [
-            'intern', 'internship', 'co-op', 'co op',
-            'summer 2025', 'summer 2026', 'fall 2025', 'spring 2026'
-        ]
-        return any(keyword in text_lower for keyword in internship_keywords)
-
-    def _extract_job_details(self, comment: Dict, text: str) -> Dict:
+    def _is_design_internship(self, text_lower: str) -> bool:
+        """Check lowercased text for both a design and an internship keyword"""
+        if self._keyword_automaton is None:
+            # Internship mentions are the rarer of the two, so test them first
+            return bool(self._INTERNSHIP_RE.search(text_lower) and self._DESIGN_RE.search(text_lower))
+
+        # Single pass over the text, stopping as soon as both kinds have been seen
+        seen = set()
+        for _, kind in self._keyword_automaton.iter(text_lower):
+            seen.add(kind)
+            if len(seen) == 2:
+                return True
+        return False
+
+    def _extract_job_details(self, comment: Dict, text: str, now_iso: str) -> Dict:
         """
         Extract structured job details from unstructured comment text
 
+        Args:
+            comment: Comment item
+            text: Raw comment HTML
+            now_iso: Posting date for comments without a usable created_at
+
         Returns:
             Standardized job dictionary or None if parsing fails
         """
         try:
             # Clean HTML tags from text
-            import html
-            text_clean = re.sub(r'<[^>]+>', ' ', text)
+            text_clean = self._TAG_RE.sub(' ', text)
             text_clean = html.unescape(text_clean)
 
             # Extract company name (usually first line or capitalized word)
@@ -188,9 +289,9 @@ class HackerNewsScraper:
                 try:
                     posted_date = datetime.fromisoformat(created_at.replace('Z', '+00:00')).isoformat()
                 except:
-                    posted_date = datetime.now().isoformat()
+                    posted_date = now_iso
             else:
-                posted_date = datetime.now().isoformat()
+                posted_date = now_iso
 
             return {
                 'id': f"hn_{comment_id}",
@@ -204,7 +305,7 @@ class HackerNewsScraper:
             }
 
         except Exception as e:
-            logger.debug(f"Error extracting job details: {str(e)}")
+            logger.debug("Error extracting job details: %s", e)
             return None
 
     def _extract_company(self, text: str) -> str:
@@ -220,12 +321,12 @@ class HackerNewsScraper:
                 return company
 
         # Pattern: "COMPANY NAME is hiring..."
-        match = re.search(r'^([A-Z][A-Za-z0-9\s&.-]+)\s+(?:is|are)\s+hiring', text, re.MULTILINE)
+        match = self._HIRING_RE.search(text)
         if match:
             return match.group(1).strip()
 
         # Pattern: "Company: XYZ"
-        match = re.search(r'Company:\s*([^\n]+)', text, re.IGNORECASE)
+        match = self._COMPANY_LABEL_RE.search(text)
         if match:
             return match.group(1).strip()
 
@@ -240,36 +341,21 @@ class HackerNewsScraper:
     def _extract_location(self, text: str) -> str:
         """Try to extract location from text"""
         # Common patterns
-        patterns = [
-            r'Location:\s*([^\n]+)',
-            r'\|\s*([A-Z][a-z]+(?:,\s*[A-Z]{2})?)\s*\|',  # | City, ST |
-            r'(?:Remote|REMOTE)',
-            r'\b([A-Z][a-z]+,\s*(?:CA|NY|TX|MA|WA|OR|CO))\b',  # City, State
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._LOCATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 location = match.group(1) if match.lastindex else match.group(0)
                 return location.strip()
 
-        # Check if "remote" appears anywhere
-        if re.search(r'\bremote\b', text, re.IGNORECASE):
-            return 'Remote'
-
+        # No need for a separate "remote anywhere" check: the case-insensitive
+        # Remote pattern above already matches any occurrence
         return 'See posting'
 
     def _extract_title(self, text: str) -> str:
         """Try to extract job title from text"""
         # Look for common title patterns
-        title_patterns = [
-            r'(?:Product|UX|UI|User Experience|Visual|Interaction)\s+(?:Design|Designer)\s+Intern',
-            r'Design\s+Intern',
-            r'Intern[:\-\s]+(?:Product|UX|UI|Design)',
-        ]
-
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._TITLE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(0).strip()
 
@@ -281,7 +367,8 @@ class HackerNewsScraper:
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.hackernews_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
     scraper = HackerNewsScraper()
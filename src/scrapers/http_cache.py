@@ -0,0 +1,63 @@
+"""
+HTTP response cache shared by the API scrapers
+Repeat runs within the TTL are served from disk instead of re-hitting the
+network (and free-tier quotas like Adzuna's 1,000 calls/month)
+"""
+
+import logging
+import requests
+from pathlib import Path
+from typing import Iterable
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+logger = logging.getLogger(__name__)
+
+# Cache lives at the project root, next to data/ (gitignored)
+CACHE_DIR = Path(__file__).parent.parent.parent / '.cache'
+
+# Default freshness window for cached responses (seconds)
+DEFAULT_EXPIRE_AFTER = 3600
+
+
+def cached_session(name: str, expire_after: int = DEFAULT_EXPIRE_AFTER,
+                   allowable_methods: Iterable[str] = ('GET', 'HEAD'),
+                   ignored_parameters: Iterable[str] = (),
+                   always_revalidate: bool = False,
+                   stale_if_error: bool = False) -> requests.Session:
+    """
+    Create a session whose responses are cached in a local SQLite file
+
+    Falls back to a plain requests.Session when requests-cache is not installed.
+
+    Args:
+        name: Cache file name under .cache/ (one per source)
+        expire_after: Seconds a cached response stays fresh
+        allowable_methods: HTTP methods whose responses may be cached
+        ignored_parameters: Request params/body fields left out of the cache key
+            and redacted from stored requests (e.g. API credentials)
+        always_revalidate: Send a conditional GET (If-None-Match / If-Modified-Since)
+            even for fresh responses, so unchanged data comes back as a bodyless 304
+        stale_if_error: Serve the stale cached response if the request fails
+
+    Returns:
+        A requests-compatible session
+    """
+    if CachedSession is None:
+        logger.debug("requests-cache not installed - HTTP responses will not be cached")
+        return requests.Session()
+
+    CACHE_DIR.mkdir(exist_ok=True)
+
+    return CachedSession(
+        str(CACHE_DIR / name),
+        backend='sqlite',
+        expire_after=expire_after,
+        allowable_methods=tuple(allowable_methods),
+        ignored_parameters=list(ignored_parameters),
+        always_revalidate=always_revalidate,
+        stale_if_error=stale_if_error,
+    )
@@ -0,0 +1,162 @@
+"""
+Shared HTTP session setup for the scrapers
+Mounts a pooled, retrying, rate-limited adapter so board fetches reuse keep-alive
+connections, stay under per-host rate limits and ride out transient 429/5xx responses
+
+Scrapers keep their own Session (headers, cache), but sessions with the same policy
+share one adapter and therefore one connection pool, so sources that hit the same
+host or CDN reuse each other's sockets and TLS contexts
+"""
+
+import functools
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.rate_limit import RateLimitedAdapter
+from .http_cache import cached_session
+
+# Connections kept open per host (and hosts kept) in the process-wide pool; sized for
+# the concurrent company-board fetches of every source sharing it
+POOL_SIZE = 50
+
+# Status codes worth retrying - rate limits and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# (connect, read) timeout - fail fast on unreachable hosts, allow slower payloads
+TIMEOUT: Tuple[float, float] = (5, 15)
+
+# Company boards fetched at once per ATS source; each source's boards share one
+# API host, so this stays well under the per-host rate limit
+BOARD_WORKERS = 8
+
+
+def build_adapter(pool_size: int = POOL_SIZE,
+                  retry_methods: Iterable[str] = Retry.DEFAULT_ALLOWED_METHODS) -> HTTPAdapter:
+    """
+    Create a rate-limited HTTPAdapter with a connection pool and retry policy
+
+    Retries back off exponentially (0.5s, 1s, 2s) and honor Retry-After. Once
+    retries run out the last response is returned as-is, so callers still see
+    the real status code from raise_for_status().
+
+    Args:
+        pool_size: Connections kept per host (and hosts kept in the pool)
+        retry_methods: HTTP methods safe to retry (idempotent ones by default)
+
+    Returns:
+        Configured HTTPAdapter
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(retry_methods),
+        raise_on_status=False,
+    )
+    return RateLimitedAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+
+_shared_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_adapter(pool_size: int, retry_methods: frozenset) -> HTTPAdapter:
+    """One adapter (and connection pool) per distinct policy, shared across sessions"""
+    return build_adapter(pool_size, retry_methods)
+
+
+def shared_adapter(pool_size: int = POOL_SIZE,
+                   retry_methods: Iterable[str] = Retry.DEFAULT_ALLOWED_METHODS) -> HTTPAdapter:
+    """
+    Get the process-wide adapter for a pool size and retry policy
+
+    Args:
+        pool_size: Connections kept per host
+        retry_methods: HTTP methods safe to retry
+
+    Returns:
+        Shared HTTPAdapter (do not close it from a single session)
+    """
+    with _shared_lock:
+        return _shared_adapter(pool_size, frozenset(retry_methods))
+
+
+def configure_session(session: requests.Session, pool_size: int = POOL_SIZE,
+                      retry_methods: Iterable[str] = Retry.DEFAULT_ALLOWED_METHODS) -> requests.Session:
+    """
+    Mount the shared pooled, retrying, rate-limited adapter on an existing session
+
+    Args:
+        session: Session to configure (plain or cached)
+        pool_size: Connections kept per host
+        retry_methods: HTTP methods safe to retry (e.g. add POST for search APIs)
+
+    Returns:
+        The same session, for chaining
+    """
+    adapter = shared_adapter(pool_size, retry_methods)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def create_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """
+    Create a new session with the shared pooled, retrying, rate-limited adapter mounted
+
+    Args:
+        pool_size: Connections kept per host
+
+    Returns:
+        Configured requests.Session
+    """
+    return configure_session(requests.Session(), pool_size)
+
+
+def revalidating_session(name: str) -> requests.Session:
+    """
+    Create a disk-cached session that revalidates every request
+
+    Each request is sent as a conditional GET (ETag / Last-Modified), so an
+    unchanged resource comes back as a bodyless 304 and is served from the
+    cache; if the request fails, the stale cached copy is served instead.
+    The shared pooled, retrying, rate-limited adapter is mounted.
+
+    Args:
+        name: Cache file name under .cache/ (one per source)
+
+    Returns:
+        Configured session
+    """
+    return configure_session(cached_session(name, always_revalidate=True, stale_if_error=True))
+
+
+def fetch_boards(fetch_company_jobs: Callable[..., List[Dict]], companies: List[Dict],
+                 handle_key: str, max_workers: int = BOARD_WORKERS) -> List[Dict]:
+    """
+    Fetch many company boards concurrently and combine their jobs
+
+    Boards are independent, so they are fetched in parallel; results keep the
+    order of `companies`.
+
+    Args:
+        fetch_company_jobs: The scraper's fetch_company_jobs(company_handle, company_name)
+        companies: Company dicts with 'name' and the board handle under handle_key
+        handle_key: Key of the board handle (e.g. 'greenhouse')
+        max_workers: Boards fetched at once
+
+    Returns:
+        Combined list of all jobs from all companies
+    """
+    def fetch(company: Dict) -> List[Dict]:
+        return fetch_company_jobs(company_handle=company[handle_key], company_name=company['name'])
+
+    all_jobs = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for jobs in executor.map(fetch, companies):
+            all_jobs.extend(jobs)
+    return all_jobs
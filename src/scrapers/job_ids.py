@@ -0,0 +1,20 @@
+"""
+Stable job identifiers shared by the scrapers
+Built-in hash() is salted per process (PYTHONHASHSEED), so ids derived from it
+change every run; a BLAKE2b digest gives the same id for the same URL every time
+"""
+
+import hashlib
+
+
+def url_digest(url: str) -> str:
+    """
+    Stable 64-bit hex digest of a job URL
+
+    Args:
+        url: Job URL (any value; converted with str())
+
+    Returns:
+        16-character hex string
+    """
+    return hashlib.blake2b(str(url).encode('utf-8', 'ignore'), digest_size=8).hexdigest()
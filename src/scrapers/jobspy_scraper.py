@@ -5,16 +5,37 @@ GitHub: https://github.com/speedyapply/JobSpy
 """
 
 import logging
+import random
 import time
 from typing import List, Dict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from .job_ids import url_digest
 
 logger = logging.getLogger(__name__)
 
 
+def _field(row: tuple, cols: Dict[str, int], name: str, default=None):
+    """Read a column from an itertuples() row, with dict.get-style default"""
+    i = cols.get(name)
+    return default if i is None else row[i]
+
+
 class JobSpyScraper:
     """Scraper using JobSpy library for multiple job boards"""
 
+    # Rate-limited searches are retried once after a jittered delay (seconds)
+    MAX_ATTEMPTS = 2
+    RETRY_DELAY = 10
+
+    # Fallback values for text columns that come back missing or empty
+    TEXT_DEFAULTS = {
+        'title': '',
+        'company': 'Unknown',
+        'location': 'Remote',
+    }
+
     def __init__(self):
         """Initialize JobSpy scraper"""
         # Removed zip_recruiter (known library issue - returns 0 jobs)
@@ -57,13 +78,39 @@ class JobSpyScraper:
 
         logger.info(f"  Running {len(search_terms)} searches: {', '.join(search_terms)}")
 
-        for i, search_term in enumerate(search_terms, 1):
-            try:
-                logger.info(f"    [{i}/{len(search_terms)}] Searching for '{search_term}'...")
+        # Each search is a blocking library call, so run the terms side by side in
+        # threads and collect the results back in search-term order
+        with ThreadPoolExecutor(max_workers=max(1, len(search_terms))) as executor:
+            futures = [
+                executor.submit(self._search, scrape_jobs, search_term, location, results_wanted, i, len(search_terms))
+                for i, search_term in enumerate(search_terms, 1)
+            ]
+            for future in futures:
+                all_jobs.extend(future.result())
+
+        logger.info(f"✓ JobSpy: {len(all_jobs)} total jobs from {len(search_terms)} searches (before deduplication)")
+
+        return all_jobs
 
-                # Add small delay before starting to be respectful
-                if i > 1:
-                    time.sleep(10)  # Rate limiting between searches
+    def _search(self, scrape_jobs, search_term: str, location: str, results_wanted: int,
+                index: int, total: int) -> List[Dict]:
+        """
+        Run one JobSpy search across all sites, retrying once if rate limited
+
+        Args:
+            scrape_jobs: jobspy.scrape_jobs
+            search_term: Search query
+            location: Job location to search in
+            results_wanted: Number of results to fetch per site
+            index: Position of this search (for logging)
+            total: Number of searches in this run (for logging)
+
+        Returns:
+            List of standardized job dictionaries
+        """
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                logger.info(f"    [{index}/{total}] Searching for '{search_term}'...")
 
                 # Scrape jobs from multiple sites
                 # Note: job_type removed - conflicts with hours_old on Indeed
@@ -80,68 +127,80 @@ class JobSpyScraper:
 
                 if jobs_df is None or jobs_df.empty:
                     logger.info(f"      ⊘ No jobs found for '{search_term}'")
-                    continue
+                    return []
 
-                # Convert DataFrame to list of dicts
-                jobs_list = jobs_df.to_dict('records')
+                # Fill missing text fields column-wise
+                jobs_df = self._fill_text_columns(jobs_df)
 
-                logger.info(f"      ✓ {len(jobs_list)} jobs found for '{search_term}'")
+                logger.info(f"      ✓ {len(jobs_df)} jobs found for '{search_term}'")
 
-                # Convert to standardized format
-                standardized = [self._normalize_job(job) for job in jobs_list]
+                # Convert to standardized format, streaming plain row tuples instead of
+                # building a dict per row
+                cols = {column: i for i, column in enumerate(jobs_df.columns)}
+                now_iso = datetime.now().isoformat()
+                standardized = [
+                    self._normalize_job(row, cols, now_iso)
+                    for row in jobs_df.itertuples(index=False, name=None)
+                ]
 
                 # Filter out any jobs that failed normalization
-                standardized = [job for job in standardized if job is not None]
-
-                all_jobs.extend(standardized)
+                return [job for job in standardized if job is not None]
 
             except Exception as e:
+                # Back off and retry only when a site pushed back with a rate limit
+                message = str(e).lower()
+                if attempt + 1 < self.MAX_ATTEMPTS and ('429' in message or 'too many requests' in message):
+                    delay = self.RETRY_DELAY + random.uniform(0, self.RETRY_DELAY / 2)
+                    logger.warning(f"      ⟳ Rate limited on '{search_term}', retrying in {delay:.0f}s")
+                    time.sleep(delay)
+                    continue
+
                 logger.error(f"      ✗ Error searching '{search_term}': {str(e)}")
-                continue
+                return []
 
-        logger.info(f"✓ JobSpy: {len(all_jobs)} total jobs from {len(search_terms)} searches (before deduplication)")
+        return []
 
-        return all_jobs
+    def _fill_text_columns(self, jobs_df):
+        """
+        Replace missing/empty title, company and location values in one pass per column
 
-    def _normalize_job(self, job: Dict) -> Dict:
+        pandas represents missing cells as NaN (or None), so do the cleanup on the
+        DataFrame instead of checking every row in Python.
         """
-        Convert JobSpy job format to standardized format
+        jobs_df = jobs_df.copy()
+        for column, default in self.TEXT_DEFAULTS.items():
+            if column not in jobs_df:
+                jobs_df[column] = default
+                continue
+            values = jobs_df[column].fillna(default).astype(str)
+            jobs_df[column] = values.mask(values == '', default)
+        return jobs_df
+
+    def _normalize_job(self, row: tuple, cols: Dict[str, int], now_iso: str) -> Dict:
+        """
+        Convert a JobSpy result row to standardized format
 
         JobSpy returns fields like:
         - title, company, location, job_url, description
         - date_posted, site, job_type
         - min_amount, max_amount, currency (salary info)
+
+        Args:
+            row: Row tuple from DataFrame.itertuples(index=False, name=None)
+            cols: Column name -> position in row
+            now_iso: Posting date for rows without date_posted
         """
         try:
-            # Extract required fields
-            import math
-
-            # Handle title (can be NaN from pandas DataFrame)
-            title_raw = job.get('title', '')
-            if isinstance(title_raw, float) and math.isnan(title_raw):
-                title = ''
-            else:
-                title = str(title_raw) if title_raw else ''
-
-            # Handle company (can be NaN from pandas DataFrame)
-            company_raw = job.get('company', 'Unknown')
-            if isinstance(company_raw, float) and math.isnan(company_raw):
-                company = 'Unknown'
-            else:
-                company = str(company_raw) if company_raw else 'Unknown'
+            # Extract required fields (already filled by _fill_text_columns)
+            title = _field(row, cols, 'title', '')
+            company = _field(row, cols, 'company', 'Unknown')
+            location = _field(row, cols, 'location', 'Remote')
 
-            # Handle location (can be NaN from pandas DataFrame)
-            location_raw = job.get('location', 'Remote')
-            if isinstance(location_raw, float) and math.isnan(location_raw):
-                location = 'Remote'
-            else:
-                location = str(location_raw) if location_raw else 'Remote'
-
-            job_url = job.get('job_url', '')
-            description = job.get('description', '')
+            job_url = _field(row, cols, 'job_url', '')
+            description = _field(row, cols, 'description', '')
 
             # Extract date posted (JobSpy returns datetime/date object or string)
-            date_posted = job.get('date_posted')
+            date_posted = _field(row, cols, 'date_posted')
             if isinstance(date_posted, str):
                 posted_date = date_posted
             elif date_posted is not None:
@@ -151,32 +210,28 @@ class JobSpyScraper:
                 except Exception:
                     posted_date = str(date_posted)
             else:
-                posted_date = datetime.now().isoformat()
+                posted_date = now_iso
 
             # Get source site
-            source_site = job.get('site', 'JobSpy')
+            source_site = _field(row, cols, 'site', 'JobSpy')
 
-            # Build unique ID using site and job_url hash
-            job_id = f"jobspy_{source_site}_{abs(hash(job_url))}"
+            # Build unique ID using site and job_url digest - stable across runs
+            job_id = f"jobspy_{source_site}_{url_digest(job_url)}"
 
             # Extract salary info if available
             salary_info = None
-            min_amount = job.get('min_amount')
-            max_amount = job.get('max_amount')
-            currency = job.get('currency', 'USD')
+            min_amount = _field(row, cols, 'min_amount')
+            max_amount = _field(row, cols, 'max_amount')
+            currency = _field(row, cols, 'currency', 'USD')
 
-            # Check for valid salary amounts (not None and not NaN)
-            import math
+            # Check for valid salary amounts (not None and not NaN - NaN never equals itself)
             salary_parts = []
-            if min_amount is not None and not (isinstance(min_amount, float) and math.isnan(min_amount)):
-                try:
-                    salary_parts.append(f"${int(min_amount):,}")
-                except (ValueError, TypeError):
-                    pass
-            if max_amount is not None and not (isinstance(max_amount, float) and math.isnan(max_amount)):
+            for amount in (min_amount, max_amount):
                 try:
-                    salary_parts.append(f"${int(max_amount):,}")
+                    if amount is not None and amount == amount:
+                        salary_parts.append(f"${int(amount):,}")
                 except (ValueError, TypeError):
+                    # Also covers pd.NA, whose comparisons can't be used as a bool
                     pass
             if salary_parts:
                 salary_info = f"{' - '.join(salary_parts)} {currency}"
@@ -190,25 +245,26 @@ class JobSpyScraper:
                 'description': description,
                 'posted_date': posted_date,
                 'source': f"JobSpy ({source_site.title()})",
-                'job_type': job.get('job_type'),
+                'job_type': _field(row, cols, 'job_type'),
                 'salary': salary_info
                 # Note: raw_data omitted to avoid JSON serialization issues with date objects
             }
 
         except Exception as e:
-            logger.warning(f"  Skipping job due to normalization error: {str(e)}")
+            logger.warning("  Skipping job due to normalization error: %s", e)
             return None
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.jobspy_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
     scraper = JobSpyScraper()
 
     # Fetch UI/UX design internships
     jobs = scraper.fetch_jobs(
-        search_term='UI UX design intern',
+        search_terms=['UI UX design intern'],
         location='United States',
         results_wanted=20  # Small number for testing
     )
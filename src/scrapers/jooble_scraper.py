@@ -3,12 +3,15 @@ Jooble scraper - Job aggregator with explicit internship category
 Free tier: Rate limits TBD (requires API key)
 """
 
-import os
 import requests
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from config import CONFIG, Config
+from .http_session import TIMEOUT, configure_session
+from .job_ids import url_digest
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,18 +20,24 @@ class JoobleScraper:
 
     BASE_URL = "https://api.jooble.org/api"
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, config: Config = CONFIG):
         """
         Initialize scraper with API key
 
         Args:
-            api_key: Jooble API key. If None, reads from JOOBLE_API_KEY env var
+            api_key: Jooble API key. If None, uses config.jooble_api_key (JOOBLE_API_KEY)
+            config: Runtime configuration (defaults to the environment)
         """
-        self.api_key = api_key or os.getenv('JOOBLE_API_KEY')
+        self.api_key = api_key or config.jooble_api_key
         if not self.api_key:
             logger.warning("Jooble API key not provided - skipping this source")
 
-        self.session = requests.Session()
+        # Searches are POSTs with no side effects, so they are safe to retry. They are
+        # not disk-cached: the API key is part of the URL path and would be stored
+        self.session = configure_session(
+            requests.Session(),
+            retry_methods=('GET', 'HEAD', 'POST')
+        )
         self.session.headers.update({
             'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project)',
             'Content-Type': 'application/json'
@@ -59,7 +68,7 @@ class JoobleScraper:
         }
 
         try:
-            response = self.session.post(url, json=payload, timeout=10)
+            response = self.session.post(url, json=payload, timeout=TIMEOUT)
             response.raise_for_status()
 
             data = response.json()
@@ -68,7 +77,8 @@ class JoobleScraper:
             logger.info(f"✓ Jooble: {len(jobs)} jobs found for '{keywords}'")
 
             # Convert to standardized format
-            return [self._normalize_job(job) for job in jobs]
+            now_iso = datetime.now().isoformat()
+            return [self._normalize_job(job, now_iso) for job in jobs]
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
@@ -81,7 +91,7 @@ class JoobleScraper:
             logger.error(f"✗ Jooble: Request failed: {str(e)}")
             return []
 
-    def _normalize_job(self, job: Dict) -> Dict:
+    def _normalize_job(self, job: Dict, now_iso: str) -> Dict:
         """Convert Jooble job format to standardized format"""
 
         # Extract company
@@ -93,7 +103,7 @@ class JoobleScraper:
             location = 'Remote'
 
         # Extract date (Jooble provides updated date)
-        updated = job.get('updated', datetime.now().isoformat())
+        updated = job.get('updated') or now_iso
 
         # Job URL
         job_url = job.get('link', '')
@@ -105,7 +115,7 @@ class JoobleScraper:
         source_info = job.get('source', '')
 
         return {
-            'id': f"jooble_{job.get('id', hash(job_url))}",
+            'id': f"jooble_{job.get('id', url_digest(job_url))}",
             'title': job.get('title', ''),
             'company': company,
             'location': location,
@@ -114,17 +124,19 @@ class JoobleScraper:
             'posted_date': updated,
             'source': 'Jooble',
             'salary': salary,
-            'source_site': source_info,
-            'raw_data': job
+            'source_site': source_info
         }
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.jooble_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
-    # Test with API key from environment
-    scraper = JoobleScraper()
+    # Test with API key from environment (or .env file)
+    from dotenv import load_dotenv
+    load_dotenv()
+    scraper = JoobleScraper(config=Config.from_env())
 
     if scraper.api_key:
         # Fetch UI/UX design internships
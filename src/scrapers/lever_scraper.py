@@ -3,11 +3,17 @@ Lever scraper - No authentication required for public job boards
 Used by: Netflix, Shopify, IDEO, Stripe (some divisions), and many more
 """
 
+import json
 import requests
 import logging
+import threading
+import time
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from .http_cache import CACHE_DIR
+from .http_session import TIMEOUT, create_session, fetch_boards
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,11 +22,17 @@ class LeverScraper:
 
     BASE_URL = "https://api.lever.co/v0/postings/{company}"
 
+    # Handles that returned 404, e.g. {"oldco": 1760000000.0}; skipped until re-probed
+    NOT_FOUND_CACHE_FILE = CACHE_DIR / 'lever_404.json'
+    NOT_FOUND_TTL = 7 * 86400
+
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project)'
         })
+        self._not_found = self._load_not_found()
+        self._not_found_lock = threading.Lock()
 
     def fetch_company_jobs(self, company_handle: str, company_name: str) -> List[Dict]:
         """
@@ -36,19 +48,27 @@ class LeverScraper:
         url = self.BASE_URL.format(company=company_handle)
 
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, timeout=TIMEOUT)
             response.raise_for_status()
 
             jobs = response.json()
 
+            # A handle that was missing before has come back
+            if company_handle in self._not_found:
+                with self._not_found_lock:
+                    self._not_found.pop(company_handle, None)
+
             logger.info(f"✓ Lever: {company_name} - {len(jobs)} jobs found")
 
             # Convert to standardized format
-            return [self._normalize_job(job, company_name) for job in jobs]
+            now_iso = datetime.now().isoformat()
+            return [self._normalize_job(job, company_name, now_iso) for job in jobs]
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 logger.warning(f"✗ Lever: {company_name} - Not found (check handle)")
+                with self._not_found_lock:
+                    self._not_found[company_handle] = time.time()
             else:
                 logger.error(f"✗ Lever: {company_name} - HTTP {e.response.status_code}")
             return []
@@ -57,7 +77,24 @@ class LeverScraper:
             logger.error(f"✗ Lever: {company_name} - Request failed: {str(e)}")
             return []
 
-    def _normalize_job(self, job: Dict, company_name: str) -> Dict:
+    def _load_not_found(self) -> Dict[str, float]:
+        """Read the handle -> last 404 time cache (empty if missing or unreadable)"""
+        try:
+            with open(self.NOT_FOUND_CACHE_FILE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_not_found(self) -> None:
+        """Persist the handle -> last 404 time cache; caching is best-effort"""
+        try:
+            self.NOT_FOUND_CACHE_FILE.parent.mkdir(exist_ok=True)
+            with open(self.NOT_FOUND_CACHE_FILE, 'w') as f:
+                json.dump(self._not_found, f)
+        except OSError as e:
+            logger.debug(f"Could not save Lever 404 cache: {str(e)}")
+
+    def _normalize_job(self, job: Dict, company_name: str, now_iso: str) -> Dict:
         """Convert Lever job format to standardized format"""
 
         # Extract location
@@ -81,11 +118,10 @@ class LeverScraper:
             'location': location,
             'url': job.get('hostedUrl', ''),
             'description': full_description,
-            'posted_date': job.get('createdAt', datetime.now().isoformat()),
+            'posted_date': job.get('createdAt') or now_iso,
             'source': 'Lever',
             'team': team,
-            'commitment': commitment,
-            'raw_data': job
+            'commitment': commitment
         }
 
     def fetch_multiple_companies(self, companies: List[Dict]) -> List[Dict]:
@@ -98,23 +134,31 @@ class LeverScraper:
         Returns:
             Combined list of all jobs from all companies
         """
-        all_jobs = []
-
         lever_companies = [c for c in companies if 'lever' in c]
+
+        # Skip handles that 404'd recently; they are re-probed once NOT_FOUND_TTL passes
+        now = time.time()
+        to_fetch = [
+            c for c in lever_companies
+            if now - self._not_found.get(c['lever'], 0) >= self.NOT_FOUND_TTL
+        ]
+        if len(to_fetch) < len(lever_companies):
+            skipped = len(lever_companies) - len(to_fetch)
+            logger.info(f"  Skipping {skipped} Lever handles that returned 404 recently")
+            lever_companies = to_fetch
+
         logger.info(f"Fetching from {len(lever_companies)} Lever companies...")
 
-        for company in lever_companies:
-            jobs = self.fetch_company_jobs(
-                company_handle=company['lever'],
-                company_name=company['name']
-            )
-            all_jobs.extend(jobs)
+        all_jobs = fetch_boards(self.fetch_company_jobs, lever_companies, 'lever')
+
+        self._save_not_found()
 
         return all_jobs
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.lever_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
     scraper = LeverScraper()
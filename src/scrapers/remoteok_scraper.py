@@ -5,11 +5,15 @@ RemoteOK scraper - No authentication required, completely free
 IMPORTANT: RemoteOK requires attribution. Add a link back to remoteok.com
 """
 
+import re
+import orjson
 import requests
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
-import time
+
+from .http_cache import cached_session
+from .http_session import TIMEOUT, configure_session
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +23,18 @@ class RemoteOKScraper:
 
     API_URL = "https://remoteok.com/api"
 
+    # Tags that JSON encodes verbatim, so they can be searched for in the raw bytes
+    _PLAIN_TAG_RE = re.compile(r'[a-z0-9 +#.-]+')
+
+    # Seconds the cached catalog is served without contacting the server
+    CACHE_TTL = 600
+
     def __init__(self):
-        self.session = requests.Session()
+        # Full-catalog endpoint (multi-MB): reuse the last response for CACHE_TTL, then
+        # revalidate with ETag/Last-Modified so an unchanged catalog costs a bodyless 304
+        self.session = configure_session(
+            cached_session('remoteok', expire_after=self.CACHE_TTL, stale_if_error=True)
+        )
         # RemoteOK asks for descriptive user agents
         self.session.headers.update({
             'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project; Contact: your-email@example.com)'
@@ -41,51 +55,69 @@ class RemoteOKScraper:
             so we skip it.
         """
         try:
-            response = self.session.get(self.API_URL, timeout=15)
+            response = self.session.get(self.API_URL, timeout=TIMEOUT)
             response.raise_for_status()
-
-            all_jobs = response.json()
-
-            # First item is always metadata/legal notice, skip it
-            if all_jobs and isinstance(all_jobs[0], dict) and 'legal' in str(all_jobs[0]):
-                all_jobs = all_jobs[1:]
-
-            logger.info(f"✓ RemoteOK: {len(all_jobs)} total jobs fetched")
-
-            # Filter by tags if specified
+            content = response.content
+
+            # Any matching job has the tag as a quoted JSON string somewhere in the
+            # payload; if it never appears, skip decoding the catalog altogether.
+            # RemoteOK tags are lowercase, so the bytes are searched as-is (no copy)
+            search_tag_lc = search_tag.lower() if search_tag else None
+            if (search_tag_lc and self._PLAIN_TAG_RE.fullmatch(search_tag_lc)
+                    and f'"{search_tag_lc}"'.encode() not in content):
+                logger.info(f"✓ RemoteOK: catalog fetched, no jobs tagged '{search_tag}'")
+                return []
+
+            # The body is already in memory, so one C-level decode beats streaming it
+            jobs = orjson.loads(content)
+
+            matched_jobs = []
+            total = 0
+            for index, job in enumerate(jobs):
+                # First item is always metadata/legal notice, skip it
+                if index == 0 and isinstance(job, dict) and 'legal' in str(job):
+                    continue
+                total += 1
+
+                # Filter by tags if specified
+                if search_tag_lc and not any(
+                    tag.lower() == search_tag_lc for tag in job.get('tags') or ()
+                ):
+                    continue
+                matched_jobs.append(job)
+
+            logger.info(f"✓ RemoteOK: {total} total jobs fetched")
             if search_tag:
-                filtered_jobs = [
-                    job for job in all_jobs
-                    if search_tag.lower() in [tag.lower() for tag in job.get('tags', [])]
-                ]
-                logger.info(f"  → {len(filtered_jobs)} jobs match tag '{search_tag}'")
-                all_jobs = filtered_jobs
+                logger.info(f"  → {len(matched_jobs)} jobs match tag '{search_tag}'")
 
             # Convert to standardized format
-            return [self._normalize_job(job) for job in all_jobs]
+            now_iso = datetime.now().isoformat()
+            return [self._normalize_job(job, now_iso) for job in matched_jobs]
 
         except requests.exceptions.RequestException as e:
             logger.error(f"✗ RemoteOK: Request failed: {str(e)}")
             return []
 
-    def _normalize_job(self, job: Dict) -> Dict:
+        except orjson.JSONDecodeError as e:
+            logger.error(f"✗ RemoteOK: Invalid JSON response: {str(e)}")
+            return []
+
+    def _normalize_job(self, job: Dict, now_iso: str) -> Dict:
         """Convert RemoteOK job format to standardized format"""
 
-        # RemoteOK uses epoch timestamps (handle both int and string)
-        posted_timestamp = job.get('date', time.time())
-        try:
-            if isinstance(posted_timestamp, str):
-                # Try to parse as ISO date string first
-                try:
-                    posted_date = posted_timestamp
-                except:
-                    # If that fails, try as timestamp
-                    posted_date = datetime.fromtimestamp(float(posted_timestamp)).isoformat()
-            else:
+        # RemoteOK sends ISO date strings; epoch numbers are formatted, anything else
+        # falls back to the fetch time
+        posted_timestamp = job.get('date')
+        if isinstance(posted_timestamp, str):
+            posted_date = posted_timestamp
+        elif isinstance(posted_timestamp, (int, float)):
+            try:
                 posted_date = datetime.fromtimestamp(posted_timestamp).isoformat()
-        except (ValueError, TypeError):
-            # Fallback to current time if parsing fails
-            posted_date = datetime.now().isoformat()
+            except (ValueError, OverflowError, OSError):
+                # Out-of-range or NaN epoch
+                posted_date = now_iso
+        else:
+            posted_date = now_iso
 
         # Extract location
         location = job.get('location', 'Remote')
@@ -115,13 +147,13 @@ class RemoteOKScraper:
             'source': 'RemoteOK',
             'tags': tags,
             'salary_min': job.get('salary_min'),
-            'salary_max': job.get('salary_max'),
-            'raw_data': job
+            'salary_max': job.get('salary_max')
         }
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.remoteok_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
     scraper = RemoteOKScraper()
@@ -5,9 +5,13 @@ Aggregates from We Work Remotely, Remotive, Himalayas, and Jobicy
 
 import feedparser
 import logging
+import re
 from typing import List, Dict
 from datetime import datetime
-import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .http_session import TIMEOUT, revalidating_session
+from .job_ids import url_digest
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +27,35 @@ class RSSJobScraper:
         'Jobicy': 'https://jobicy.com/jobs-rss-feed.php'
     }
 
+    DESIGN_KEYWORDS = [
+        'design', 'ux', 'ui', 'user experience', 'user interface',
+        'product design', 'visual design', 'figma', 'sketch'
+    ]
+
+    INTERNSHIP_KEYWORDS = [
+        'intern', 'internship', 'co-op', 'co op',
+        'junior', 'entry level', 'entry-level',
+        'graduate', 'new grad'
+    ]
+
+    # One case-insensitive scan per field instead of a substring search per keyword
+    # (plain alternation, so keywords still match anywhere in the text)
+    _DESIGN_RE = re.compile('|'.join(map(re.escape, DESIGN_KEYWORDS)), re.IGNORECASE)
+    _INTERNSHIP_RE = re.compile('|'.join(map(re.escape, INTERNSHIP_KEYWORDS)), re.IGNORECASE)
+
+    # Pattern: City, Country or City, ST
+    _LOCATION_RE = re.compile(r'\b([A-Z][a-z]+(?:,\s*[A-Z]{2,})?)\b')
+
+    # "X - Title" prefixes that are not company names
+    _COMPANY_BLOCKLIST_RE = re.compile(r'remote|design|engineer', re.IGNORECASE)
+
     def __init__(self):
         """Initialize RSS scraper"""
-        pass
+        # Feeds change rarely between runs, so most come back as a 304
+        self.session = revalidating_session('rss')
+        self.session.headers.update({
+            'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project)'
+        })
 
     def fetch_jobs(self) -> List[Dict]:
         """
@@ -36,32 +66,52 @@ class RSSJobScraper:
         """
         all_jobs = []
 
-        for feed_name, feed_url in self.FEEDS.items():
-            try:
-                logger.info(f"  Fetching {feed_name} RSS feed...")
+        # Each feed is on its own host (one request each), so fetch them all at once;
+        # map() keeps feed order
+        with ThreadPoolExecutor(max_workers=len(self.FEEDS)) as executor:
+            results = executor.map(self._fetch_one_feed, self.FEEDS.keys(), self.FEEDS.values())
+            for jobs in results:
+                all_jobs.extend(jobs)
 
-                # Parse RSS feed
-                feed = feedparser.parse(feed_url)
+        logger.info(f"✓ RSS Feeds: {len(all_jobs)} total jobs found")
+        return all_jobs
 
-                if not feed.entries:
-                    logger.warning(f"⊘ {feed_name}: No entries found in RSS feed")
-                    continue
+    def _fetch_one_feed(self, feed_name: str, feed_url: str) -> List[Dict]:
+        """
+        Fetch and process a single RSS feed
 
-                # Filter and process entries
-                jobs = self._process_feed_entries(feed.entries, feed_name)
+        Args:
+            feed_name: Name of the feed source
+            feed_url: URL of the RSS feed
 
-                logger.info(f"✓ {feed_name}: {len(jobs)} design/intern jobs found")
-                all_jobs.extend(jobs)
+        Returns:
+            List of standardized job dictionaries (empty on error)
+        """
+        try:
+            logger.info(f"  Fetching {feed_name} RSS feed...")
 
-                # Be polite - small delay between feeds
-                time.sleep(1)
+            # Download through the cached session, then parse the body; headers are
+            # passed along so feedparser still sees the encoding and base URL
+            response = self.session.get(feed_url, timeout=TIMEOUT)
+            response.raise_for_status()
 
-            except Exception as e:
-                logger.error(f"✗ {feed_name}: Error fetching RSS feed: {str(e)}")
-                continue
+            headers = {key.lower(): value for key, value in response.headers.items()}
+            headers['content-location'] = response.url
+            feed = feedparser.parse(response.content, response_headers=headers)
 
-        logger.info(f"✓ RSS Feeds: {len(all_jobs)} total jobs found")
-        return all_jobs
+            if not feed.entries:
+                logger.warning(f"⊘ {feed_name}: No entries found in RSS feed")
+                return []
+
+            # Filter and process entries
+            jobs = self._process_feed_entries(feed.entries, feed_name)
+
+            logger.info(f"✓ {feed_name}: {len(jobs)} design/intern jobs found")
+            return jobs
+
+        except Exception as e:
+            logger.error(f"✗ {feed_name}: Error fetching RSS feed: {str(e)}")
+            return []
 
     def _process_feed_entries(self, entries: List, feed_name: str) -> List[Dict]:
         """
@@ -75,87 +125,81 @@ class RSSJobScraper:
             List of standardized job dictionaries
         """
         jobs = []
+        now_iso = datetime.now().isoformat()
 
         for entry in entries:
+            # Read the fields shared by the filters and extractors once per entry
+            title = entry.get('title', '')
+            description = entry.get('summary', '') or entry.get('description', '')
+
             # Check if design/UX related
-            if not self._is_design_related(entry):
+            if not self._is_design_related(title, description):
                 continue
 
             # Check if internship (or skip this filter for remote jobs - we'll let keyword filter handle it)
             # Remote jobs often don't explicitly say "internship" in title
-            # if not self._is_internship(entry):
+            # if not self._is_internship(title, description):
             #     continue
 
             # Extract job details
-            job = self._extract_job_from_entry(entry, feed_name)
+            job = self._extract_job_from_entry(entry, feed_name, title, description, now_iso)
             if job:
                 jobs.append(job)
 
         return jobs
 
-    def _is_design_related(self, entry) -> bool:
-        """Check if entry is design/UX related"""
-        title = entry.get('title', '').lower()
-        description = entry.get('summary', '').lower() or entry.get('description', '').lower()
+    def _is_design_related(self, title: str, description: str) -> bool:
+        """Check if entry title/description is design/UX related"""
+        return bool(self._DESIGN_RE.search(title) or self._DESIGN_RE.search(description))
 
-        design_keywords = [
-            'design', 'ux', 'ui', 'user experience', 'user interface',
-            'product design', 'visual design', 'figma', 'sketch'
-        ]
+    def _is_internship(self, title: str, description: str) -> bool:
+        """Check if entry title/description mentions internship"""
+        return bool(self._INTERNSHIP_RE.search(title) or self._INTERNSHIP_RE.search(description))
 
-        return any(keyword in title or keyword in description for keyword in design_keywords)
-
-    def _is_internship(self, entry) -> bool:
-        """Check if entry mentions internship"""
-        title = entry.get('title', '').lower()
-        description = entry.get('summary', '').lower() or entry.get('description', '').lower()
-
-        internship_keywords = [
-            'intern', 'internship', 'co-op', 'co op',
-            'junior', 'entry level', 'entry-level',
-            'graduate', 'new grad'
-        ]
-
-        return any(keyword in title or keyword in description for keyword in internship_keywords)
-
-    def _extract_job_from_entry(self, entry, feed_name: str) -> Dict:
+    def _extract_job_from_entry(self, entry, feed_name: str, title: str, description: str,
+                                now_iso: str) -> Dict:
         """
         Extract job details from RSS entry
 
         Args:
             entry: RSS feed entry
             feed_name: Name of the feed source
+            title: Entry title ('' if missing)
+            description: Entry summary, falling back to its description
+            now_iso: Posting date for entries without a usable date
 
         Returns:
             Standardized job dictionary or None
         """
+
         try:
             # Get basic fields
-            title = entry.get('title', 'Remote Design Position')
             link = entry.get('link', '')
 
             # Extract company from title or author
-            company = self._extract_company(entry)
+            company = self._extract_company(entry, title)
 
             # Extract location
-            location = self._extract_location(entry)
+            location = self._extract_location(title, description)
 
-            # Get description
-            description = entry.get('summary', '') or entry.get('description', '')
+            # Untitled entries get a placeholder title
+            if 'title' not in entry:
+                title = 'Remote Design Position'
 
             # Get published date
             published = entry.get('published') or entry.get('updated')
-            if published:
+            published_parsed = entry.get('published_parsed') if published else None
+            if published_parsed and len(published_parsed) >= 6:
                 try:
-                    # Parse various date formats
-                    posted_date = datetime(*entry.get('published_parsed')[:6]).isoformat() if entry.get('published_parsed') else published
-                except:
-                    posted_date = datetime.now().isoformat()
+                    posted_date = datetime(*published_parsed[:6]).isoformat()
+                except ValueError:
+                    # e.g. a leap second (tm_sec=60) that datetime rejects
+                    posted_date = now_iso
             else:
-                posted_date = datetime.now().isoformat()
+                posted_date = published or now_iso
 
-            # Build unique ID
-            job_id = f"rss_{feed_name.replace(' ', '_').lower()}_{abs(hash(link))}"
+            # Build unique ID - stable across runs
+            job_id = f"rss_{feed_name.replace(' ', '_').lower()}_{url_digest(link)}"
 
             return {
                 'id': job_id,
@@ -169,19 +213,17 @@ class RSSJobScraper:
             }
 
         except Exception as e:
-            logger.debug(f"Error extracting job from RSS entry: {str(e)}")
+            logger.debug("Error extracting job from RSS entry: %s", e)
             return None
 
-    def _extract_company(self, entry) -> str:
-        """Extract company name from entry"""
+    def _extract_company(self, entry, title: str) -> str:
+        """Extract company name from entry author, title or tags"""
         # Try author field first
         author = entry.get('author', '')
         if author and len(author) < 100:
             return author
 
         # Try to extract from title (pattern: "Company Name: Job Title" or "Job Title at Company")
-        title = entry.get('title', '')
-
         # Pattern: "Company: Title" or "Company - Title"
         if ':' in title:
             company = title.split(':')[0].strip()
@@ -199,7 +241,7 @@ class RSSJobScraper:
             parts = title.split(' - ')
             if len(parts) > 1:
                 company = parts[0].strip()
-                if len(company) < 50 and not any(word in company.lower() for word in ['remote', 'design', 'engineer']):
+                if len(company) < 50 and not self._COMPANY_BLOCKLIST_RE.search(company):
                     return company
 
         # Fallback to category or tag
@@ -212,20 +254,14 @@ class RSSJobScraper:
 
         return 'Remote Company'
 
-    def _extract_location(self, entry) -> str:
-        """Extract location from entry"""
-        title = entry.get('title', '').lower()
-        description = (entry.get('summary', '') or entry.get('description', '')).lower()
-
-        # Check for remote
-        if 'remote' in title or 'remote' in description[:200]:
+    def _extract_location(self, title: str, description: str) -> str:
+        """Extract location from entry title/description"""
+        # Check for remote (only the start of the description is lowercased)
+        if 'remote' in title.lower() or 'remote' in description[:200].lower():
             return 'Remote'
 
         # Look for location in title or description
-        import re
-        # Pattern: City, Country or City, ST
-        location_pattern = r'\b([A-Z][a-z]+(?:,\s*[A-Z]{2,})?)\b'
-        match = re.search(location_pattern, entry.get('title', ''))
+        match = self._LOCATION_RE.search(title)
         if match:
             return match.group(1)
 
@@ -233,7 +269,8 @@ class RSSJobScraper:
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.rss_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
     scraper = RSSJobScraper()
@@ -3,11 +3,15 @@ The Muse scraper - Best for internships with explicit category filter
 Free tier: 3,600 requests/hour (requires API key)
 """
 
-import os
+import orjson
 import requests
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from config import CONFIG, Config
+from .http_session import TIMEOUT, create_session
 
 logger = logging.getLogger(__name__)
 
@@ -17,18 +21,23 @@ class TheMuseScraper:
 
     BASE_URL = "https://www.themuse.com/api/public/jobs"
 
-    def __init__(self, api_key: str = None):
+    # Concurrent page fetches after the first page
+    MAX_WORKERS = 4
+
+    def __init__(self, api_key: str = None, config: Config = CONFIG):
         """
         Initialize scraper with API key
 
         Args:
-            api_key: The Muse API key. If None, reads from THEMUSE_API_KEY env var
+            api_key: The Muse API key. If None, uses config.themuse_api_key (THEMUSE_API_KEY)
+            config: Runtime configuration (defaults to the environment)
         """
-        self.api_key = api_key or os.getenv('THEMUSE_API_KEY')
+        self.api_key = api_key or config.themuse_api_key
         if not self.api_key:
             logger.warning("The Muse API key not provided - skipping this source")
 
-        self.session = requests.Session()
+        # Pooled keep-alive connection is reused across the paginated requests
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project)'
         })
@@ -61,35 +70,46 @@ class TheMuseScraper:
         max_pages = 5  # Limit to 5 pages (100 jobs) to avoid excessive API calls
 
         try:
-            for page in range(max_pages):
-                params['page'] = page
-
-                response = self.session.get(self.BASE_URL, params=params, timeout=10)
-                response.raise_for_status()
-
-                data = response.json()
-                results = data.get('results', [])
-
-                if not results:
-                    break  # No more results
-
-                all_jobs.extend(results)
-
-                # Check if there are more pages
-                page_count = data.get('page_count', 0)
-                if page >= page_count - 1:
-                    break
+            # The first page tells us how many pages exist
+            data = self._fetch_page(0, params)
+            all_jobs.extend(data.get('results', []))
+            page_count = data.get('page_count', 0)
+
+            if all_jobs and page_count > 1:
+                # Remaining pages are independent; fetch them at once and walk them in order
+                with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                    pages = executor.map(
+                        lambda page: self._fetch_page(page, params),
+                        range(1, min(max_pages, page_count))
+                    )
+                    for data in pages:
+                        results = data.get('results', [])
+                        if not results:
+                            break  # No more results
+                        all_jobs.extend(results)
 
             logger.info(f"✓ The Muse: {len(all_jobs)} {category} {level} jobs found")
 
             # Convert to standardized format
-            return [self._normalize_job(job) for job in all_jobs]
+            now_iso = datetime.now().isoformat()
+            return [self._normalize_job(job, now_iso) for job in all_jobs]
 
         except requests.exceptions.RequestException as e:
             logger.error(f"✗ The Muse: Request failed: {str(e)}")
             return []
 
-    def _normalize_job(self, job: Dict) -> Dict:
+        except orjson.JSONDecodeError as e:
+            logger.error(f"✗ The Muse: Invalid JSON response: {str(e)}")
+            return []
+
+    def _fetch_page(self, page: int, params: Dict) -> Dict:
+        """Fetch a single results page from The Muse"""
+        response = self.session.get(self.BASE_URL, params={**params, 'page': page}, timeout=TIMEOUT)
+        response.raise_for_status()
+
+        return orjson.loads(response.content)
+
+    def _normalize_job(self, job: Dict, now_iso: str) -> Dict:
         """Convert The Muse job format to standardized format"""
 
         # Extract company info
@@ -104,7 +124,7 @@ class TheMuseScraper:
             location = 'Remote'
 
         # Extract publication date
-        publication_date = job.get('publication_date', datetime.now().isoformat())
+        publication_date = job.get('publication_date') or now_iso
 
         # Build job URL
         job_url = job.get('refs', {}).get('landing_page', '')
@@ -125,17 +145,19 @@ class TheMuseScraper:
             'posted_date': publication_date,
             'source': 'TheMuse',
             'categories': categories,
-            'levels': levels,
-            'raw_data': job
+            'levels': levels
         }
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.themuse_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
-    # Test with API key from environment
-    scraper = TheMuseScraper()
+    # Test with API key from environment (or .env file)
+    from dotenv import load_dotenv
+    load_dotenv()
+    scraper = TheMuseScraper(config=Config.from_env())
 
     if scraper.api_key:
         # Fetch design internships
@@ -9,6 +9,9 @@ import logging
 from typing import List, Dict
 from datetime import datetime
 
+from .http_session import TIMEOUT, fetch_boards, revalidating_session
+from .job_ids import url_digest
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,7 +21,7 @@ class WorkableScraper:
     BASE_URL = "https://apply.workable.com/api/v1/widget/accounts/{company}"
 
     def __init__(self):
-        self.session = requests.Session()
+        self.session = revalidating_session('workable')
         self.session.headers.update({
             'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project)',
             'Accept': 'application/json'
@@ -38,7 +41,7 @@ class WorkableScraper:
         url = self.BASE_URL.format(company=company_handle)
 
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, timeout=TIMEOUT)
             response.raise_for_status()
 
             data = response.json()
@@ -47,7 +50,8 @@ class WorkableScraper:
             logger.info(f"✓ Workable: {company_name} - {len(jobs)} jobs found")
 
             # Convert to standardized format
-            return [self._normalize_job(job, company_name) for job in jobs]
+            now_iso = datetime.now().isoformat()
+            return [self._normalize_job(job, company_name, now_iso) for job in jobs]
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -60,7 +64,7 @@ class WorkableScraper:
             logger.error(f"✗ Workable: {company_name} - Request failed: {str(e)}")
             return []
 
-    def _normalize_job(self, job: Dict, company_name: str) -> Dict:
+    def _normalize_job(self, job: Dict, company_name: str, now_iso: str) -> Dict:
         """Convert Workable job format to standardized format"""
 
         # Extract location
@@ -81,17 +85,16 @@ class WorkableScraper:
             job_url = f"https://apply.workable.com/{job.get('account_name')}/j/{job['shortcode']}/"
 
         return {
-            'id': f"workable_{job.get('shortcode', abs(hash(job_url)))}",
+            'id': f"workable_{job.get('shortcode', url_digest(job_url))}",
             'title': job.get('title', ''),
             'company': company_name,
             'location': location,
             'url': job_url,
             'description': job.get('description', ''),
-            'posted_date': job.get('created_at', datetime.now().isoformat()),
+            'posted_date': job.get('created_at') or now_iso,
             'source': 'Workable',
             'department': department,
-            'employment_type': job.get('employment_type'),
-            'raw_data': job
+            'employment_type': job.get('employment_type')
         }
 
     def fetch_multiple_companies(self, companies: List[Dict]) -> List[Dict]:
@@ -104,23 +107,15 @@ class WorkableScraper:
         Returns:
             Combined list of all jobs from all companies
         """
-        all_jobs = []
-
         workable_companies = [c for c in companies if 'workable' in c]
         logger.info(f"Fetching from {len(workable_companies)} Workable companies...")
 
-        for company in workable_companies:
-            jobs = self.fetch_company_jobs(
-                company_handle=company['workable'],
-                company_name=company['name']
-            )
-            all_jobs.extend(jobs)
-
-        return all_jobs
+        return fetch_boards(self.fetch_company_jobs, workable_companies, 'workable')
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.workable_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
     scraper = WorkableScraper()
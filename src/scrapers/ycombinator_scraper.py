@@ -4,6 +4,7 @@ Simple HTML parsing for startup internship postings
 Respects robots.txt (Crawl-delay: 30)
 """
 
+import re
 import requests
 import logging
 from typing import List, Dict
@@ -11,6 +12,21 @@ from datetime import datetime
 from bs4 import BeautifulSoup
 import time
 
+from .http_session import revalidating_session
+
+# Prefer the C-backed lxml tree builder; fall back to the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is a C extension; fall back to the keyword regex without it
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,26 +38,52 @@ class YCombinatorScraper:
     # Respect robots.txt crawl-delay: 30 seconds
     CRAWL_DELAY = 30
 
+    INTERNSHIP_KEYWORDS = [
+        'intern',
+        'internship',
+        'co-op',
+        'co op',
+        'student',
+        'summer 2025',
+        'summer 2026'
+    ]
+
+    # Plain substring alternation - same matches as testing each keyword with `in`
+    _INTERNSHIP_RE = re.compile('|'.join(map(re.escape, INTERNSHIP_KEYWORDS)))
+
     def __init__(self):
-        self.session = requests.Session()
+        # Single-pass automaton over the internship keywords (None without pyahocorasick)
+        self._keyword_automaton = None
+        if ahocorasick is not None:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for keyword in self.INTERNSHIP_KEYWORDS:
+                self._keyword_automaton.add_word(keyword, keyword)
+            self._keyword_automaton.make_automaton()
+
+        # The jobs page changes slowly, so repeat runs usually get a 304
+        self.session = revalidating_session('ycombinator')
         self.session.headers.update({
             'User-Agent': 'UI-UX-Internship-Tracker/1.0 (Educational Project; Respecting robots.txt)'
         })
-        self.last_request_time = 0
+        self.last_request_time = None  # time.monotonic() of the last request
 
     def _respect_crawl_delay(self):
         """
         Ensure we respect the 30-second crawl delay from robots.txt
+
+        Measured on the monotonic clock so wall-clock adjustments (NTP, DST)
+        cannot shorten or stretch the delay. The sleep only holds this
+        scraper's worker thread; the other sources keep fetching meanwhile.
         """
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        if self.last_request_time is not None:
+            time_since_last_request = time.monotonic() - self.last_request_time
 
-        if time_since_last_request < self.CRAWL_DELAY:
-            sleep_time = self.CRAWL_DELAY - time_since_last_request
-            logger.debug(f"Respecting crawl-delay: sleeping {sleep_time:.1f}s")
-            time.sleep(sleep_time)
+            if time_since_last_request < self.CRAWL_DELAY:
+                sleep_time = self.CRAWL_DELAY - time_since_last_request
+                logger.debug(f"Respecting crawl-delay: sleeping {sleep_time:.1f}s")
+                time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     def fetch_jobs(self) -> List[Dict]:
         """
@@ -56,7 +98,7 @@ class YCombinatorScraper:
             response = self.session.get(self.BASE_URL, timeout=15)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
 
             # Find all job postings (tr elements with class "athing submission")
             job_rows = soup.find_all('tr', class_='athing submission')
@@ -64,8 +106,9 @@ class YCombinatorScraper:
             logger.info(f"✓ YC Jobs: {len(job_rows)} total jobs found")
 
             all_jobs = []
+            now_iso = datetime.now().isoformat()
             for row in job_rows:
-                job = self._parse_job_row(row)
+                job = self._parse_job_row(row, now_iso)
                 if job:
                     all_jobs.append(job)
 
@@ -80,12 +123,13 @@ class YCombinatorScraper:
             logger.error(f"✗ YC Jobs: Request failed: {str(e)}")
             return []
 
-    def _parse_job_row(self, row) -> Dict:
+    def _parse_job_row(self, row, now_iso: str) -> Dict:
         """
         Parse a single job row from the HN jobs page
 
         Args:
             row: BeautifulSoup element for the job row
+            now_iso: Posting date for rows without an age timestamp
 
         Returns:
             Dict with job information, or None if parsing fails
@@ -121,7 +165,7 @@ class YCombinatorScraper:
             # Find the next row which contains the age
             next_row = row.find_next_sibling('tr')
             age_span = next_row.find('span', class_='age') if next_row else None
-            posted_date = datetime.now().isoformat()
+            posted_date = now_iso
 
             if age_span:
                 # Extract timestamp if available
@@ -140,16 +184,11 @@ class YCombinatorScraper:
                 'url': url,
                 'description': title,  # HN jobs don't have descriptions on listing page
                 'posted_date': posted_date,
-                'source': 'YCombinator',
-                'raw_data': {
-                    'job_id': job_id,
-                    'title': title,
-                    'url': url
-                }
+                'source': 'YCombinator'
             }
 
         except Exception as e:
-            logger.debug(f"Failed to parse job row: {str(e)}")
+            logger.debug("Failed to parse job row: %s", e)
             return None
 
     def _is_internship(self, job: Dict) -> bool:
@@ -165,28 +204,19 @@ class YCombinatorScraper:
         title_lower = job.get('title', '').lower()
         url_lower = job.get('url', '').lower()
 
-        internship_keywords = [
-            'intern',
-            'internship',
-            'co-op',
-            'co op',
-            'student',
-            'summer 2025',
-            'summer 2026'
-        ]
-
         # Check title and URL
         text_to_check = f"{title_lower} {url_lower}"
 
-        for keyword in internship_keywords:
-            if keyword in text_to_check:
-                return True
+        if self._keyword_automaton is None:
+            return self._INTERNSHIP_RE.search(text_to_check) is not None
 
-        return False
+        # Stop at the first keyword hit
+        return next(self._keyword_automaton.iter(text_to_check), None) is not None
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper - run from src/ as a module (python -m scrapers.ycombinator_scraper),
+    # since the package-relative imports need the scrapers package
     logging.basicConfig(level=logging.INFO)
 
     scraper = YCombinatorScraper()
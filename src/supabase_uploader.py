@@ -4,22 +4,37 @@ Designed to run after main.py completes scraping
 """
 
 import json
-import os
 import sys
 import math
+import threading
 from datetime import datetime
-from typing import List, Dict, Any
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain, islice, repeat
+from typing import List, Dict, Any, Iterable, Iterator, Set
 from supabase import create_client, Client
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from config import CONFIG, Config
+
+try:
+    import ijson
+except ImportError:
+    # Without ijson, jobs.json is loaded whole with json.load
+    ijson = None
 
 class SupabaseUploader:
-    def __init__(self):
+    # Rows per upsert request
+    UPSERT_CHUNK_SIZE = 500
+
+    # URLs per existence probe (they are sent in the request URL)
+    URL_PROBE_SIZE = 100
+
+    # Chunks uploaded concurrently (and the most held in memory at once)
+    MAX_WORKERS = 8
+
+    def __init__(self, config: Config = CONFIG):
         """Initialize Supabase client"""
-        supabase_url = os.getenv("SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_KEY")
+        supabase_url = config.supabase_url
+        supabase_key = config.supabase_key
 
         if not supabase_url or not supabase_key:
             raise ValueError(
@@ -31,6 +46,7 @@ class SupabaseUploader:
         self.updated_count = 0
         self.error_count = 0
         self.new_jobs_count = 0  # Track newly inserted jobs
+        self._count_lock = threading.Lock()  # Counters are updated from upload threads
 
     def load_jobs_from_file(self, file_path: str = "data/jobs.json") -> List[Dict[str, Any]]:
         """Load jobs from jobs.json file"""
@@ -47,6 +63,36 @@ class SupabaseUploader:
             print(f"✗ Error parsing JSON: {e}")
             sys.exit(1)
 
+    def iter_jobs_from_file(self, file_path: str = "data/jobs.json") -> Iterator[Dict[str, Any]]:
+        """Stream jobs from jobs.json one at a time (loads the whole file without ijson)"""
+        if ijson is None:
+            return iter(self.load_jobs_from_file(file_path))
+
+        try:
+            f = open(file_path, 'rb')
+        except FileNotFoundError:
+            print(f"✗ Error: {file_path} not found")
+            sys.exit(1)
+
+        print(f"✓ Streaming jobs from {file_path}")
+        return self._stream_jobs(f, file_path)
+
+    def _stream_jobs(self, f, file_path: str) -> Iterator[Dict[str, Any]]:
+        """Yield each entry of the top-level "jobs" array, closing the file when done"""
+        streamed = 0
+        with f:
+            try:
+                for job in ijson.items(f, 'jobs.item', use_float=True):
+                    yield job
+                    streamed += 1
+                return
+            except ijson.JSONError as e:
+                # Older files may hold bare NaN values, which json.load accepts but
+                # strict parsers don't; pick up where streaming stopped
+                print(f"⚠ Could not stream {file_path} ({e}), loading it whole instead")
+
+        yield from self.load_jobs_from_file(file_path)[streamed:]
+
     def sanitize_value(self, value: Any) -> Any:
         """Sanitize values to be JSON compliant (handle NaN, Infinity)"""
         # Handle numeric values that aren't JSON compliant
@@ -65,79 +111,136 @@ class SupabaseUploader:
             return [self.sanitize_value(item) for item in value]
         return value
 
-    def transform_job_for_database(self, job: Dict[str, Any]) -> Dict[str, Any]:
-        """Transform job data to match database schema"""
-        # Sanitize the entire job object first to catch any NaN/Infinity values
-        sanitized_job = self.sanitize_value(job)
+    def transform_job_for_database(self, job: Dict[str, Any],
+                                   scraped_date: str = None) -> Dict[str, Any]:
+        """Transform job data to match database schema (scraped_date defaults to today)"""
+        # Sanitize only the columns we upload to catch any NaN/Infinity values,
+        # rather than walking every field of the scraped job
+        sanitize = self.sanitize_value
 
         return {
-            'id': sanitized_job.get('id'),
-            'title': sanitized_job.get('title'),
-            'company': sanitized_job.get('company'),
-            'location': sanitized_job.get('location'),
-            'url': sanitized_job.get('url'),
-            'description': sanitized_job.get('description'),
-            'posted_date': sanitized_job.get('posted_date'),
-            'scraped_date': datetime.now().date().isoformat(),
-            'source': sanitized_job.get('source'),
-            'job_type': sanitized_job.get('job_type', 'internship'),
-            'salary': sanitized_job.get('salary'),
-            'relevance_score': sanitized_job.get('relevance_score'),
-            'score_breakdown': sanitized_job.get('score_breakdown'),  # JSONB field
+            'id': sanitize(job.get('id')),
+            'title': sanitize(job.get('title')),
+            'company': sanitize(job.get('company')),
+            'location': sanitize(job.get('location')),
+            'url': sanitize(job.get('url')),
+            'description': sanitize(job.get('description')),
+            'posted_date': sanitize(job.get('posted_date')),
+            'scraped_date': scraped_date or datetime.now().date().isoformat(),
+            'source': sanitize(job.get('source')),
+            'job_type': sanitize(job.get('job_type', 'internship')),
+            'salary': sanitize(job.get('salary')),
+            'relevance_score': sanitize(job.get('relevance_score')),
+            'score_breakdown': sanitize(job.get('score_breakdown')),  # JSONB field
         }
 
-    def upload_jobs(self, jobs: List[Dict[str, Any]]) -> int:
+    def upload_jobs(self, jobs: Iterable[Dict[str, Any]]) -> int:
         """
-        Upload jobs to Supabase using upsert
+        Upload jobs to Supabase using upsert, in chunks of UPSERT_CHUNK_SIZE
+
+        Args:
+            jobs: List of jobs, or an iterator such as iter_jobs_from_file()
 
         Returns:
             Number of new jobs inserted (not updated)
         """
-        if not jobs:
+        # Transform jobs as they are read; only the database columns are kept.
+        # The whole batch shares one scraped_date
+        scraped_date = datetime.now().date().isoformat()
+        transformed_jobs = map(self.transform_job_for_database, jobs, repeat(scraped_date))
+
+        # Fixed-size chunks keep each request body and existence probe small
+        chunks = iter(lambda: list(islice(transformed_jobs, self.UPSERT_CHUNK_SIZE)), [])
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
             print("⚠ No jobs to upload")
             return 0
 
-        print(f"\n⬆ Uploading {len(jobs)} jobs to Supabase...")
+        if isinstance(jobs, list):
+            print(f"\n⬆ Uploading {len(jobs)} jobs to Supabase...")
+        else:
+            print("\n⬆ Uploading jobs to Supabase...")
+
+        # Chunks are independent upserts (PostgREST resolves conflicts per row), so
+        # upload them concurrently. At most MAX_WORKERS chunks are in flight; the next
+        # chunk is only read once one finishes, so a streamed file stays streamed
+        new_job_urls = set()
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            in_flight = set()
+            for chunk in chain([first_chunk], chunks):
+                if len(in_flight) >= self.MAX_WORKERS:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        new_job_urls |= future.result()
+                in_flight.add(executor.submit(self._upload_chunk, chunk))
+
+            for future in wait(in_flight).done:
+                new_job_urls |= future.result()
 
-        # Get existing job URLs to determine which are new
-        # Using URL as the dedup key since it's more stable than scraper-generated IDs
-        try:
-            existing_urls = set()
-            response = self.client.table('intern_jobs').select('url').execute()
-            if response.data:
-                existing_urls = {job['url'] for job in response.data}
-        except Exception as e:
-            print(f"⚠ Warning: Could not fetch existing job URLs: {e}")
-            existing_urls = set()
+        self.new_jobs_count = len(new_job_urls)
 
-        # Transform all jobs
-        transformed_jobs = [self.transform_job_for_database(job) for job in jobs]
+        print(f"✓ Successfully upserted {self.uploaded_count} jobs")
+        print(f"  → {self.new_jobs_count} new jobs added")
+        # New URLs are counted before upserting, so failed chunks can make this negative
+        print(f"  → {max(self.uploaded_count - self.new_jobs_count, 0)} existing jobs updated")
 
-        # Count new jobs (jobs with URLs not in existing set)
-        new_job_urls = {job['url'] for job in transformed_jobs if job.get('url') and job['url'] not in existing_urls}
-        self.new_jobs_count = len(new_job_urls)
+        return self.new_jobs_count
+
+    def _upload_chunk(self, chunk: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Probe and upsert one chunk, falling back to individual uploads on failure
+
+        Returns:
+            URLs in the chunk that were not already in the database
+        """
+        # Count new jobs (jobs with URLs not already in the database)
+        # Using URL as the dedup key since it's more stable than scraper-generated IDs
+        urls = {job['url'] for job in chunk if job.get('url')}
+        new_urls = urls - self._fetch_existing_urls(list(urls))
 
-        # Batch upsert (insert or update if exists)
         try:
-            # Use URL as conflict resolution since it's more stable than scraper IDs
-            # If same job appears from multiple scrapers with different IDs, it updates the existing one
-            # Requires: ALTER TABLE intern_jobs ADD CONSTRAINT intern_jobs_url_unique UNIQUE (url);
-            response = self.client.table('intern_jobs').upsert(
-                transformed_jobs,
-                on_conflict='url'  # URL-based deduplication (more reliable than ID)
-            ).execute()
-
-            self.uploaded_count = len(response.data)
-            print(f"✓ Successfully upserted {self.uploaded_count} jobs")
-            print(f"  → {self.new_jobs_count} new jobs added")
-            print(f"  → {self.uploaded_count - self.new_jobs_count} existing jobs updated")
+            upserted = self._upsert_chunk(chunk)
+            with self._count_lock:
+                self.uploaded_count += upserted
 
         except Exception as e:
             print(f"✗ Error during batch upload: {e}")
             print("⚠ Falling back to individual uploads...")
-            self._upload_jobs_individually(transformed_jobs)
+            self._upload_jobs_individually(chunk)
 
-        return self.new_jobs_count
+        return new_urls
+
+    def _upsert_chunk(self, chunk: List[Dict[str, Any]]) -> int:
+        """
+        Upsert one chunk of transformed jobs
+
+        Returns:
+            Number of rows upserted
+        """
+        # Use URL as conflict resolution since it's more stable than scraper IDs
+        # If same job appears from multiple scrapers with different IDs, it updates the existing one
+        # Requires: ALTER TABLE intern_jobs ADD CONSTRAINT intern_jobs_url_unique UNIQUE (url);
+        response = self.client.table('intern_jobs').upsert(
+            chunk,
+            on_conflict='url'  # URL-based deduplication (more reliable than ID)
+        ).execute()
+
+        return len(response.data)
+
+    def _fetch_existing_urls(self, urls: List[str]) -> Set[str]:
+        """Return which of the given URLs are already in the database (probed in small batches)"""
+        existing_urls = set()
+        try:
+            # URLs travel in the query string, so keep each probe well under URL length limits
+            for i in range(0, len(urls), self.URL_PROBE_SIZE):
+                response = self.client.table('intern_jobs').select('url').in_(
+                    'url', urls[i:i + self.URL_PROBE_SIZE]
+                ).execute()
+                if response.data:
+                    existing_urls.update(job['url'] for job in response.data)
+        except Exception as e:
+            print(f"⚠ Warning: Could not fetch existing job URLs: {e}")
+        return existing_urls
 
     def _upload_jobs_individually(self, jobs: List[Dict[str, Any]]) -> None:
         """Fallback: Upload jobs one by one"""
@@ -149,23 +252,47 @@ class SupabaseUploader:
                 ).execute()
 
                 if response.data:
-                    self.uploaded_count += 1
+                    with self._count_lock:
+                        self.uploaded_count += 1
                     if i % 10 == 0:
                         print(f"  Progress: {i}/{len(jobs)} jobs uploaded")
 
             except Exception as e:
-                self.error_count += 1
+                with self._count_lock:
+                    self.error_count += 1
                 print(f"  ✗ Error uploading job {job.get('id', 'unknown')}: {e}")
 
     def get_statistics(self) -> Dict[str, int]:
         """Get database statistics"""
+        today = datetime.now().date().isoformat()
+
+        # One round trip via the intern_stats() function (database/migrations/002);
+        # fall back to individual count queries if it hasn't been applied
+        try:
+            response = self.client.rpc('intern_stats', {'p_today': today}).execute()
+            if response.data:
+                row = response.data[0]
+                return {
+                    'total_jobs': row['total_jobs'],
+                    'jobs_posted_today': row['jobs_posted_today'],
+                    'jobs_scraped_today': row['jobs_scraped_today'],
+                    'new_jobs_count': self.new_jobs_count,  # Jobs newly added to DB
+                    'total_users': row['total_users'],
+                    'total_applications': row['total_applications']
+                }
+        except Exception as e:
+            print(f"⚠ intern_stats() unavailable, counting tables individually: {e}")
+
+        return self._get_statistics_by_query(today)
+
+    def _get_statistics_by_query(self, today: str) -> Dict[str, int]:
+        """Get database statistics with one count query per figure"""
         try:
             # Count total jobs
             response = self.client.table('intern_jobs').select('id', count='exact').execute()
             total_jobs = response.count
 
             # Count jobs POSTED today (by companies, not scraped today)
-            today = datetime.now().date().isoformat()
             response = self.client.table('intern_jobs').select(
                 'id', count='exact'
             ).eq('posted_date', today).execute()
@@ -221,11 +348,15 @@ def main():
     print("\n🚀 Starting Supabase Upload...")
     print("-"*50)
 
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+
     try:
-        uploader = SupabaseUploader()
+        uploader = SupabaseUploader(Config.from_env())
 
-        # Load jobs from file
-        jobs = uploader.load_jobs_from_file()
+        # Stream jobs from file
+        jobs = uploader.iter_jobs_from_file()
 
         # Upload to Supabase
         uploader.upload_jobs(jobs)
@@ -4,9 +4,17 @@ Handles cases where same job appears on multiple platforms
 """
 
 import logging
+from collections import defaultdict
+from itertools import count
 from typing import List, Dict, Tuple
 from difflib import SequenceMatcher
 
+try:
+    # Indel similarity is 2*LCS/total length, an upper bound on SequenceMatcher.ratio()
+    from rapidfuzz.distance import Indel
+except ImportError:
+    Indel = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +43,16 @@ class JobDeduplicator:
         """
         return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
 
+    @staticmethod
+    def _normalize(value) -> str:
+        """Lowercased, stripped text of a field - handles non-string values (float, NaN, etc); '' if missing/invalid"""
+        text = str(value).lower().strip() if value not in [None, ''] else ''
+        return '' if text in ['nan', 'none'] else text
+
+    def _job_key(self, job: Dict) -> Tuple[str, str]:
+        """Normalized (company, title) of a job, computed once per job rather than per comparison"""
+        return self._normalize(job.get('company', '')), self._normalize(job.get('title', ''))
+
     def are_jobs_duplicate(self, job1: Dict, job2: Dict) -> Tuple[bool, str]:
         """
         Check if two jobs are duplicates
@@ -46,44 +64,47 @@ class JobDeduplicator:
         Returns:
             Tuple of (is_duplicate, reason)
         """
+        return self._compare(job1, self._job_key(job1), job2, self._job_key(job2))
+
+    def _compare(self, job1: Dict, key1: Tuple[str, str],
+                 job2: Dict, key2: Tuple[str, str]) -> Tuple[bool, str]:
+        """are_jobs_duplicate on pre-normalized (company, title) keys"""
         # Exact ID match (same source)
         if job1.get('id') == job2.get('id'):
             return True, "Exact ID match"
 
-        # Same company check - handle non-string values (float, NaN, etc)
-        company1_raw = job1.get('company', '')
-        company2_raw = job2.get('company', '')
-
-        # Convert to string if not already (handles float, NaN, etc)
-        company1 = str(company1_raw).lower().strip() if company1_raw not in [None, ''] else ''
-        company2 = str(company2_raw).lower().strip() if company2_raw not in [None, ''] else ''
+        company1, title1 = key1
+        company2, title2 = key2
 
         # Skip if NaN or invalid company names
-        if company1 in ['nan', 'none', ''] or company2 in ['nan', 'none', '']:
+        if not company1 or not company2:
             return False, "Missing or invalid company"
 
         # Different companies = not duplicate
         if company1 != company2:
             return False, "Different companies"
 
-        # Same company - check title similarity - handle non-string values
-        title1_raw = job1.get('title', '')
-        title2_raw = job2.get('title', '')
-
-        title1 = str(title1_raw).lower().strip() if title1_raw not in [None, ''] else ''
-        title2 = str(title2_raw).lower().strip() if title2_raw not in [None, ''] else ''
-
-        if title1 in ['nan', 'none', ''] or title2 in ['nan', 'none', '']:
+        # Same company - check title similarity
+        if not title1 or not title2:
             return False, "Missing or invalid title"
 
         # Exact title match
         if title1 == title2:
             return True, f"Exact match: {company1}"
 
-        # Fuzzy title match
-        similarity = self.calculate_similarity(title1, title2)
-        if similarity >= self.title_threshold:
-            return True, f"Similar titles: {company1} ({similarity:.2f})"
+        # Fuzzy title match; the upper bounds below (C-level Indel similarity when
+        # rapidfuzz is installed, then real_quick_ratio/quick_ratio) rule out most
+        # dissimilar titles before the full ratio(), without changing the result
+        if Indel is not None and not Indel.normalized_similarity(
+                title1, title2, score_cutoff=self.title_threshold - 1e-9):
+            return False, f"Different roles at {company1}"
+
+        matcher = SequenceMatcher(None, title1, title2)
+        if (matcher.real_quick_ratio() >= self.title_threshold
+                and matcher.quick_ratio() >= self.title_threshold):
+            similarity = matcher.ratio()
+            if similarity >= self.title_threshold:
+                return True, f"Similar titles: {company1} ({similarity:.2f})"
 
         return False, f"Different roles at {company1}"
 
@@ -100,14 +121,50 @@ class JobDeduplicator:
         if not jobs:
             return []
 
-        unique_jobs = []
+        # Kept jobs keyed by insertion sequence; dict order is the kept-list order.
+        # keys holds each kept job's normalized (company, title), so kept jobs are
+        # not re-normalized on every comparison
+        unique = {}
+        keys = {}
+        sequence = count()
+
+        # A duplicate must share either the id or the (valid) company, so only those
+        # jobs are compared instead of every kept job
+        by_id = defaultdict(set)
+        by_company = defaultdict(set)
+
+        def keep(job: Dict, key: Tuple[str, str]) -> None:
+            seq = next(sequence)
+            unique[seq] = job
+            keys[seq] = key
+            by_id[job.get('id')].add(seq)
+            company = key[0]
+            if company:
+                by_company[company].add(seq)
+
+        def drop(seq: int) -> None:
+            job = unique.pop(seq)
+            company = keys.pop(seq)[0]
+            by_id[job.get('id')].discard(seq)
+            if company:
+                by_company[company].discard(seq)
+
         duplicates_found = 0
 
         for job in jobs:
             is_duplicate = False
+            key = self._job_key(job)
+            company = key[0]
 
-            for existing_job in unique_jobs:
-                is_dup, reason = self.are_jobs_duplicate(job, existing_job)
+            candidates = by_id.get(job.get('id'), set())
+            if company:
+                candidates = candidates | by_company.get(company, set())
+
+            # Check candidates in kept order so the first match is the same one a
+            # full scan of the kept list would find
+            for seq in sorted(candidates):
+                existing_job = unique[seq]
+                is_dup, reason = self._compare(job, key, existing_job, keys[seq])
 
                 if is_dup:
                     is_duplicate = True
@@ -118,17 +175,19 @@ class JobDeduplicator:
                     existing_score = existing_job.get('relevance_score', 0)
 
                     if job_score > existing_score:
-                        # Replace existing with new one
-                        unique_jobs.remove(existing_job)
-                        unique_jobs.append(job)
-                        logger.debug(f"Replaced duplicate (better score): {reason}")
+                        # Replace existing with new one (moves to the end, as before)
+                        drop(seq)
+                        keep(job, key)
+                        logger.debug("Replaced duplicate (better score): %s", reason)
                     else:
-                        logger.debug(f"Skipped duplicate: {reason}")
+                        logger.debug("Skipped duplicate: %s", reason)
 
                     break
 
             if not is_duplicate:
-                unique_jobs.append(job)
+                keep(job, key)
+
+        unique_jobs = list(unique.values())
 
         logger.info(f"Deduplication: {len(jobs)} jobs → {len(unique_jobs)} unique ({duplicates_found} duplicates removed)")
 
@@ -146,9 +205,26 @@ class JobDeduplicator:
         """
         duplicates = []
 
+        # Only jobs sharing an id or a (valid) company can be duplicates
+        by_id = defaultdict(list)
+        by_company = defaultdict(list)
+        keys = [self._job_key(job) for job in jobs]
+        for i, job in enumerate(jobs):
+            by_id[job.get('id')].append(i)
+            company = keys[i][0]
+            if company:
+                by_company[company].append(i)
+
         for i, job1 in enumerate(jobs):
-            for job2 in jobs[i+1:]:
-                is_dup, reason = self.are_jobs_duplicate(job1, job2)
+            company = keys[i][0]
+            candidates = set(by_id[job1.get('id')])
+            if company:
+                candidates.update(by_company[company])
+
+            # Later jobs only, in list order - the same pairs a full scan would report
+            for j in sorted(c for c in candidates if c > i):
+                job2 = jobs[j]
+                is_dup, reason = self._compare(job1, keys[i], job2, keys[j])
                 if is_dup:
                     duplicates.append((job1, job2, reason))
 
@@ -3,30 +3,72 @@ Discord Webhook Notifier
 Sends notifications about new internships and daily reminders
 """
 
-import os
+import sys
 import logging
+import orjson
 import requests
-from datetime import datetime
+from urllib3.util.retry import Retry
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import List, Dict, Any, Optional
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Run directly (python src/utils/discord_notifier.py), src/utils rather than src is
+# on sys.path; add src the way main.py does
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import CONFIG, Config
+from utils.rate_limit import RateLimitedAdapter
 
 logger = logging.getLogger(__name__)
 
 
+def _display_value(value: Any, default: str) -> str:
+    """Field text for an embed, or the default for empty/NaN values (pandas NaN prints as 'nan')"""
+    if not value:
+        return default
+    text = str(value)
+    return default if text == 'nan' else text
+
+
 class DiscordNotifier:
     """Send Discord notifications via webhook"""
 
-    def __init__(self, webhook_url: Optional[str] = None):
+    # Retry rate limits (429, honoring Retry-After) and failed connections with
+    # exponential backoff plus jitter. A POST is not idempotent, so read errors and
+    # 5xx responses are final: Discord may already have posted the message
+    RETRY = Retry(
+        total=3,
+        read=0,
+        backoff_factor=1.0,
+        backoff_max=30,
+        backoff_jitter=0.5,
+        status_forcelist=(429,),
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False,
+    )
+
+    # Characters of the summary embed spent listing jobs beyond the first five;
+    # keeps the whole message under Discord's 6000-character embed total
+    OVERFLOW_LIST_CHARS = 2000
+
+    def __init__(self, webhook_url: Optional[str] = None, config: Config = CONFIG):
         """
         Initialize Discord notifier
 
         Args:
-            webhook_url: Discord webhook URL (or read from DISCORD_WEBHOOK_URL env var)
+            webhook_url: Discord webhook URL (or config.discord_webhook_url / DISCORD_WEBHOOK_URL)
+            config: Runtime configuration (defaults to the environment)
         """
-        self.webhook_url = webhook_url or os.getenv("DISCORD_WEBHOOK_URL")
+        self.webhook_url = webhook_url or config.discord_webhook_url
+
+        # One keep-alive connection to the webhook host, so back-to-back
+        # notifications skip the TCP/TLS handshake after the first. Posts are
+        # paced by the process-wide per-host token bucket to stay under
+        # Discord's webhook rate limit instead of tripping 429s
+        self._session = requests.Session()
+        self._session.mount('https://', RateLimitedAdapter(pool_connections=1, pool_maxsize=4,
+                                                           max_retries=self.RETRY))
 
         if not self.webhook_url:
             logger.warning("Discord webhook URL not configured - notifications disabled")
@@ -59,9 +101,10 @@ class DiscordNotifier:
             if embeds:
                 payload["embeds"] = embeds
 
-            response = requests.post(
+            response = self._session.post(
                 self.webhook_url,
-                json=payload,
+                data=orjson.dumps(payload),
+                headers={'Content-Type': 'application/json'},
                 timeout=10
             )
 
@@ -76,6 +119,10 @@ class DiscordNotifier:
             logger.error(f"Error sending Discord notification: {e}")
             return False
 
+    def close(self) -> None:
+        """Close the pooled webhook connection"""
+        self._session.close()
+
     def send_daily_reminder(self, total_jobs: int = 0, jobs_today: int = 0) -> bool:
         """
         Send daily reminder to apply to internships
@@ -87,8 +134,9 @@ class DiscordNotifier:
         Returns:
             True if successful, False otherwise
         """
-        # Create reminder message
-        timestamp = datetime.now().strftime('%A, %B %d, %Y')
+        # Create reminder message; one clock read serves the footer and embed timestamp
+        now = datetime.now(timezone.utc)
+        timestamp = now.astimezone().strftime('%A, %B %d, %Y')
 
         if jobs_today > 0:
             content = f"@everyone **Daily Internship Reminder** \n\n**{jobs_today} internships posted today by companies!**\n\nRemember to check and apply to today's fresh opportunities!"
@@ -114,7 +162,7 @@ class DiscordNotifier:
             "footer": {
                 "text": f"Updated on {timestamp}"
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }
 
         return self.send_message(content, embeds=[embed])
@@ -141,47 +189,25 @@ class DiscordNotifier:
         content = f"@everyone **New UI/UX Internships Found!** \n\n{len(new_jobs)} new opportunities posted!"
 
         # Create embeds for each job
-        embeds = []
-        for job in jobs_to_show:
-            company = job.get('company', 'Unknown Company')
-            title = job.get('title', 'Unknown Title')
-            location = job.get('location', 'Unknown Location')
-            url = job.get('url', '')
-            source = job.get('source', 'Unknown Source')
-            salary = job.get('salary', 'Not specified')
-
-            # Create title with link if URL available
-            job_title = f"[{title}]({url})" if url else title
-
-            embed = {
-                "title": company,
-                "description": job_title,
-                "color": 0x00FF00,  # Green for new jobs
-                "fields": [
-                    {
-                        "name": "Location",
-                        "value": str(location) if location and str(location) != 'nan' else "Remote/Not specified",
-                        "inline": True
-                    },
-                    {
-                        "name": "Salary",
-                        "value": str(salary) if salary and str(salary) != 'nan' else "Not specified",
-                        "inline": True
-                    },
-                    {
-                        "name": "Source",
-                        "value": source,
-                        "inline": True
-                    }
-                ]
-            }
-
-            embeds.append(embed)
+        embeds = [self._build_job_embed(job) for job in jobs_to_show]
 
-        # Add summary embed
+        # Add summary embed, listing the remaining jobs compactly as far as they fit
         if remaining > 0:
+            lines = []
+            used = 0
+            for job in new_jobs[len(jobs_to_show):]:
+                line = self._format_overflow_line(job)
+                if used + len(line) + 1 > self.OVERFLOW_LIST_CHARS:
+                    break
+                lines.append(line)
+                used += len(line) + 1
+
+            unlisted = remaining - len(lines)
+            if unlisted:
+                lines.append(f"_...and {unlisted} more! Check the database for all opportunities._")
+
             summary_embed = {
-                "description": f"_...and {remaining} more! Check the database for all opportunities._",
+                "description": "\n".join(lines),
                 "color": 0x5865F2,
                 "footer": {
                     "text": f"Total internships available: {total_jobs}"
@@ -191,6 +217,60 @@ class DiscordNotifier:
 
         return self.send_message(content, embeds=embeds)
 
+    @staticmethod
+    def _build_job_embed(job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the embed for a single new job
+
+        Args:
+            job: Job dictionary
+
+        Returns:
+            Discord embed object
+        """
+        company = job.get('company', 'Unknown Company')
+        title = job.get('title', 'Unknown Title')
+        location = job.get('location', 'Unknown Location')
+        url = job.get('url', '')
+        source = job.get('source', 'Unknown Source')
+        salary = job.get('salary', 'Not specified')
+
+        # Create title with link if URL available
+        job_title = f"[{title}]({url})" if url else title
+
+        return {
+            "title": company,
+            "description": job_title,
+            "color": 0x00FF00,  # Green for new jobs
+            "fields": [
+                {
+                    "name": "Location",
+                    "value": _display_value(location, "Remote/Not specified"),
+                    "inline": True
+                },
+                {
+                    "name": "Salary",
+                    "value": _display_value(salary, "Not specified"),
+                    "inline": True
+                },
+                {
+                    "name": "Source",
+                    "value": source,
+                    "inline": True
+                }
+            ]
+        }
+
+    @staticmethod
+    def _format_overflow_line(job: Dict[str, Any]) -> str:
+        """One-line summary of a job for the summary embed"""
+        company = job.get('company', 'Unknown Company')
+        title = job.get('title', 'Unknown Title')
+        url = job.get('url', '')
+
+        job_title = f"[{title}]({url})" if url else title
+        return f"• **{company}** - {job_title}"
+
     def send_scraper_success(self, stats: Dict[str, Any]) -> bool:
         """
         Send notification about successful scraper run
@@ -233,7 +313,7 @@ class DiscordNotifier:
                     "inline": True
                 }
             ],
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
         return self.send_message(content, embeds=[embed])
@@ -254,7 +334,7 @@ class DiscordNotifier:
             "title": "Error Details",
             "description": f"```{error_msg[:1000]}```",  # Limit to 1000 chars
             "color": 0xFF0000,  # Red for errors
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
         return self.send_message(content, embeds=[embed])
@@ -265,8 +345,10 @@ if __name__ == "__main__":
     import logging
     logging.basicConfig(level=logging.INFO)
 
-    # You need to set DISCORD_WEBHOOK_URL in your environment
-    notifier = DiscordNotifier()
+    # You need to set DISCORD_WEBHOOK_URL in your environment (or .env file)
+    from dotenv import load_dotenv
+    load_dotenv()
+    notifier = DiscordNotifier(config=Config.from_env())
 
     if notifier.enabled:
         print("Testing daily reminder...")
@@ -292,5 +374,6 @@ if __name__ == "__main__":
             }
         ]
         notifier.send_new_jobs_notification(test_jobs, total_jobs=92)
+        notifier.close()
     else:
         print("Discord webhook not configured. Set DISCORD_WEBHOOK_URL environment variable.")
@@ -2,8 +2,10 @@
 Generate markdown README with job listings
 """
 
+import functools
+import io
 import logging
-from typing import List, Dict
+from typing import List, Dict, TextIO
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from collections import defaultdict
@@ -11,6 +13,65 @@ from collections import defaultdict
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_posted_date(posted_date: str) -> datetime:
+    """
+    Parse a posted date into a naive datetime, once per distinct string
+
+    Raises:
+        ValueError/AttributeError: If the date is not in a supported format
+    """
+    if 'T' in posted_date:
+        # ISO format with time: '2025-11-05T12:00:00'
+        posted = datetime.fromisoformat(posted_date.replace('Z', '+00:00'))
+        # Convert to naive datetime for comparison
+        if posted.tzinfo is not None:
+            posted = posted.replace(tzinfo=None)
+        return posted
+
+    # Date only: '2025-11-05'
+    return datetime.strptime(posted_date[:10], '%Y-%m-%d')
+
+
+@functools.lru_cache(maxsize=1024)
+def _relative_date(posted_date: str, now: datetime) -> str:
+    """format_relative_date body, memoized on (posted_date, now) - listings share a handful of dates"""
+    if not posted_date:
+        return 'Unknown'
+
+    try:
+        # Parse the posted date (handle various formats)
+        posted = _parse_posted_date(posted_date)
+
+        # Calculate time difference
+        diff = now - posted
+
+        # Handle future dates (edge case)
+        if diff.days < 0:
+            return 'Just posted'
+
+        # Format based on time difference
+        if diff.days == 0:
+            return 'Today'
+        elif diff.days == 1:
+            return '1d ago'
+        elif diff.days < 7:
+            return f'{diff.days}d ago'
+        elif diff.days < 30:
+            weeks = diff.days // 7
+            return f'{weeks}w ago'
+        elif diff.days < 365:
+            months = diff.days // 30
+            return f'{months}mo ago'
+        else:
+            years = diff.days // 365
+            return f'{years}y ago'
+
+    except (ValueError, AttributeError) as e:
+        logger.warning(f"Failed to parse date '{posted_date}': {e}")
+        return 'Unknown'
+
+
 class MarkdownGenerator:
     """Generates markdown README with job listings"""
 
@@ -80,59 +141,19 @@ class MarkdownGenerator:
         return '-'
 
     @staticmethod
-    def format_relative_date(posted_date: str) -> str:
+    def format_relative_date(posted_date: str, now: datetime = None) -> str:
         """
         Convert ISO date string to relative time format
 
         Args:
             posted_date: ISO format date string (e.g., '2025-11-05')
+            now: Reference time (defaults to now); pass one snapshot per README
+                so repeated dates are served from the cache
 
         Returns:
             Relative time string (e.g., '5d ago', '2w ago', '3mo ago')
         """
-        if not posted_date:
-            return 'Unknown'
-
-        try:
-            # Parse the posted date (handle various formats)
-            if 'T' in posted_date:
-                # ISO format with time: '2025-11-05T12:00:00'
-                posted = datetime.fromisoformat(posted_date.replace('Z', '+00:00'))
-                # Convert to naive datetime for comparison
-                if posted.tzinfo is not None:
-                    posted = posted.replace(tzinfo=None)
-            else:
-                # Date only: '2025-11-05'
-                posted = datetime.strptime(posted_date[:10], '%Y-%m-%d')
-
-            # Calculate time difference
-            now = datetime.now()
-            diff = now - posted
-
-            # Handle future dates (edge case)
-            if diff.days < 0:
-                return 'Just posted'
-
-            # Format based on time difference
-            if diff.days == 0:
-                return 'Today'
-            elif diff.days == 1:
-                return '1d ago'
-            elif diff.days < 7:
-                return f'{diff.days}d ago'
-            elif diff.days < 30:
-                weeks = diff.days // 7
-                return f'{weeks}w ago'
-            elif diff.days < 365:
-                months = diff.days // 30
-                return f'{months}mo ago'
-            else:
-                years = diff.days // 365
-                return f'{years}y ago'
-
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Failed to parse date '{posted_date}': {e}")
-            return 'Unknown'
+        return _relative_date(posted_date, now or datetime.now())
 
     def generate_readme(self, jobs: List[Dict], stats: Dict = None) -> str:
         """
@@ -145,41 +166,47 @@ class MarkdownGenerator:
         Returns:
             Markdown string
         """
+        buffer = io.StringIO()
+        self.write_readme(jobs, buffer, stats)
+        return buffer.getvalue()
+
+    def write_readme(self, jobs: List[Dict], out: TextIO, stats: Dict = None) -> None:
+        """
+        Write the complete README markdown to a text stream, row by row
+
+        Args:
+            jobs: List of filtered, deduplicated jobs
+            out: Writable text stream (e.g. an open file)
+            stats: Optional statistics dictionary
+        """
         now_pt = datetime.now(ZoneInfo("America/Los_Angeles"))
         now = now_pt.strftime("%Y-%m-%d %I:%M %p PT")
+        now_local = datetime.now()  # One reference time for every relative date
 
-        # Calculate statistics
+        # Calculate statistics and group jobs by company in a single pass
         total_jobs = len(jobs)
-        companies = set(job['company'] for job in jobs)
-        remote_jobs = [j for j in jobs if 'remote' in j.get('location', '').lower()]
-
-        # Calculate "new this week" count (jobs posted in last 7 days)
-        new_this_week = 0
+        jobs_by_company = defaultdict(list)
+        remote_count = 0
+        new_this_week = 0  # Jobs posted in the last 7 days
         for job in jobs:
+            jobs_by_company[job['company']].append(job)
+
+            if 'remote' in job.get('location', '').lower():
+                remote_count += 1
+
             posted_date = job.get('posted_date', '')
             if posted_date:
                 try:
-                    if 'T' in posted_date:
-                        posted = datetime.fromisoformat(posted_date.replace('Z', '+00:00'))
-                        # Convert to naive datetime for comparison
-                        if posted.tzinfo is not None:
-                            posted = posted.replace(tzinfo=None)
-                    else:
-                        posted = datetime.strptime(posted_date[:10], '%Y-%m-%d')
-
-                    days_ago = (datetime.now() - posted).days
+                    # Parsed once per distinct date and shared with the Posted column
+                    days_ago = (now_local - _parse_posted_date(posted_date)).days
                     if days_ago <= 7:
                         new_this_week += 1
                 except (ValueError, AttributeError):
                     pass
 
-        # Group jobs by company
-        jobs_by_company = defaultdict(list)
-        for job in jobs:
-            jobs_by_company[job['company']].append(job)
-
-        # Start markdown
-        md = f"""# UI/UX Design Internships 2025
+        # Start markdown; pieces are written as they are built
+        write = out.write
+        write(f"""# UI/UX Design Internships 2025
 
 > Curated list of UI/UX design internships, updated daily via automated scraping.
 
@@ -191,8 +218,8 @@ class MarkdownGenerator:
 |--------|-------|
 | Total Internships | {total_jobs} |
 | New This Week | {new_this_week} |
-| Companies Hiring | {len(companies)} |
-| Remote Opportunities | {len(remote_jobs)} |
+| Companies Hiring | {len(jobs_by_company)} |
+| Remote Opportunities | {remote_count} |
 
 ---
 
@@ -200,7 +227,7 @@ class MarkdownGenerator:
 
 | Company | Role | Location | Salary | Posted | Source | Apply |
 |---------|------|----------|--------|--------|--------|-------|
-"""
+""")
 
         # Add all jobs to table, sorted by date (newest first)
         sorted_jobs = sorted(jobs, key=lambda x: x.get('posted_date', ''), reverse=True)
@@ -214,7 +241,7 @@ class MarkdownGenerator:
             url = job.get('url', '#')
 
             # Format the relative date and salary
-            relative_date = self.format_relative_date(posted_date)
+            relative_date = self.format_relative_date(posted_date, now_local)
             salary = self.format_salary(job)
 
             # Truncate long titles
@@ -225,18 +252,18 @@ class MarkdownGenerator:
             if len(location) > 30:
                 location = location[:27] + "..."
 
-            md += f"| {company} | {title} | {location} | {salary} | {relative_date} | {source} | [Apply]({url}) |\n"
+            write(f"| {company} | {title} | {location} | {salary} | {relative_date} | {source} | [Apply]({url}) |\n")
 
         # Add companies section
-        md += "\n---\n\n"
-        md += "## Companies Currently Hiring\n\n"
+        write("\n---\n\n")
+        write("## Companies Currently Hiring\n\n")
 
         for company in sorted(jobs_by_company.keys()):
             job_count = len(jobs_by_company[company])
-            md += f"- **{company}** ({job_count} {'position' if job_count == 1 else 'positions'})\n"
+            write(f"- **{company}** ({job_count} {'position' if job_count == 1 else 'positions'})\n")
 
         # Add footer
-        md += """
+        write("""
 ---
 
 ## About This Repo
@@ -271,9 +298,7 @@ Remote jobs powered by [RemoteOK](https://remoteok.com) - the largest remote job
 **Want to contribute or run your own instance?** See [CONTRIBUTING.md](CONTRIBUTING.md) for setup instructions, architecture details, and how to add new job sources.
 
 **Built with Python & GitHub Actions** | [Report Issues](https://github.com/your-username/ui-ux-internships-2025/issues)
-"""
-
-        return md
+""")
 
     def generate_jobs_by_location(self, jobs: List[Dict]) -> str:
         """
@@ -285,7 +310,7 @@ Remote jobs powered by [RemoteOK](https://remoteok.com) - the largest remote job
         Returns:
             Markdown string
         """
-        md = "## Internships by Location\n\n"
+        md = ["## Internships by Location\n\n"]
 
         # Group by location
         by_location = defaultdict(list)
@@ -301,12 +326,12 @@ Remote jobs powered by [RemoteOK](https://remoteok.com) - the largest remote job
 
         for location in locations:
             job_list = by_location[location]
-            md += f"\n### {location} ({len(job_list)})\n\n"
+            md.append(f"\n### {location} ({len(job_list)})\n\n")
 
             for job in sorted(job_list, key=lambda x: x['company']):
-                md += f"- **{job['company']}** - {job['title']} | [Apply]({job['url']})\n"
+                md.append(f"- **{job['company']}** - {job['title']} | [Apply]({job['url']})\n")
 
-        return md
+        return ''.join(md)
 
 
 if __name__ == "__main__":
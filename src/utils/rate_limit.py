@@ -0,0 +1,81 @@
+"""
+Per-host token-bucket rate limiting shared by all HTTP sessions (scrapers and the
+Discord notifier). Concurrent requests to the same host are smoothed to a steady
+request rate instead of bursting into 429s and retry storms
+"""
+
+import threading
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+
+# Default (requests per second, burst size) for any host
+DEFAULT_RATE = (5, 10)
+
+# Hosts with their own documented limits
+HOST_RATES: Dict[str, Tuple[float, int]] = {
+    # Discord webhooks allow 5 requests per 2 seconds
+    'discord.com': (2.5, 5),
+    'discordapp.com': (2.5, 5),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket on the monotonic clock"""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens held (requests allowed back to back)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Reserve the token now (the balance may go negative) so concurrent
+            # callers queue up behind each other instead of all waking at once
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait:
+            time.sleep(wait)
+
+
+class _Limiters(dict):
+    """Lazily creates one bucket per host"""
+
+    def __missing__(self, host: str) -> TokenBucket:
+        rate, burst = HOST_RATES.get(host, DEFAULT_RATE)
+        bucket = self[host] = TokenBucket(rate, burst)
+        return bucket
+
+
+LIMITERS: Dict[str, TokenBucket] = _Limiters()
+_limiters_lock = threading.Lock()
+
+
+def acquire(url: str) -> None:
+    """Wait for a request slot for the URL's host"""
+    host = urlparse(url).netloc
+    with _limiters_lock:
+        bucket = LIMITERS[host]
+    bucket.acquire()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from the host's bucket before each request"""
+
+    def send(self, request, **kwargs):
+        acquire(request.url)
+        return super().send(request, **kwargs)
@@ -0,0 +1,8 @@
+"""
+Shared pytest setup - puts src/ on sys.path the way main.py does
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
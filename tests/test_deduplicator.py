@@ -0,0 +1,119 @@
+"""
+Tests for JobDeduplicator - which copy of a duplicate is kept, and where it ends up
+"""
+
+from utils.deduplicator import JobDeduplicator
+
+
+def _job(job_id, company, title, score=None):
+    job = {'id': job_id, 'company': company, 'title': title}
+    if score is not None:
+        job['relevance_score'] = score
+    return job
+
+
+def _ids(jobs):
+    return [job['id'] for job in jobs]
+
+
+def test_tie_keeps_first_seen():
+    jobs = [
+        _job('1', 'Figma', 'Product Design Intern', 5),
+        _job('2', 'Stripe', 'UX Design Intern', 5),
+        _job('3', 'Figma', 'Product Design Intern', 5),
+    ]
+
+    assert _ids(JobDeduplicator().deduplicate(jobs)) == ['1', '2']
+
+
+def test_missing_score_counts_as_zero():
+    jobs = [
+        _job('1', 'Figma', 'Product Design Intern'),
+        _job('2', 'Figma', 'Product Design Intern', 0),
+        _job('3', 'Figma', 'Product Design Intern', 1),
+    ]
+
+    assert _ids(JobDeduplicator().deduplicate(jobs)) == ['3']
+
+
+def test_higher_score_replaces_and_moves_to_end():
+    jobs = [
+        _job('1', 'Figma', 'Product Design Intern', 5),
+        _job('2', 'Stripe', 'UX Design Intern', 9),
+        _job('3', 'Notion', 'Design Intern', 4),
+        _job('4', 'Figma', 'Product Design Internship', 8),
+    ]
+
+    assert _ids(JobDeduplicator().deduplicate(jobs)) == ['2', '3', '4']
+
+
+def test_replacement_is_matched_by_later_duplicates():
+    jobs = [
+        _job('1', 'Figma', 'Product Design Intern', 5),
+        _job('2', 'Figma', 'Product Design Intern', 8),
+        _job('3', 'Figma', 'Product Design Intern', 7),
+        _job('4', 'Figma', 'Product Design Intern', 9),
+    ]
+
+    assert _ids(JobDeduplicator().deduplicate(jobs)) == ['4']
+
+
+def test_first_kept_match_wins():
+    # Job 3 shares an id with job 2 and a title with job 1; the earlier kept job
+    # is the one it is compared against (and replaces)
+    jobs = [
+        _job('1', 'Figma', 'Product Design Intern', 1),
+        _job('x', 'Stripe', 'UX Design Intern', 1),
+        _job('x', 'Figma', 'Product Design Intern', 2),
+    ]
+
+    assert [(job['id'], job['company']) for job in JobDeduplicator().deduplicate(jobs)] == [
+        ('x', 'Stripe'),
+        ('x', 'Figma'),
+    ]
+
+
+def test_id_match_across_companies():
+    jobs = [
+        _job('gh_1', 'Figma', 'Product Design Intern', 3),
+        _job('gh_1', 'figma inc', 'Design Intern', 2),
+    ]
+
+    assert _ids(JobDeduplicator().deduplicate(jobs)) == ['gh_1']
+
+
+def test_missing_company_or_title_is_never_fuzzy_matched():
+    jobs = [
+        _job('1', None, 'Product Design Intern'),
+        _job('2', float('nan'), 'Product Design Intern'),
+        _job('3', 'Figma', ''),
+        _job('4', 'Figma', None),
+    ]
+
+    assert _ids(JobDeduplicator().deduplicate(jobs)) == ['1', '2', '3', '4']
+
+
+def test_company_match_is_case_insensitive_and_titles_fuzzy():
+    jobs = [
+        _job('1', 'Figma', 'Product Design Intern', 1),
+        _job('2', ' FIGMA ', 'Product Design Internship', 1),
+        _job('3', 'Figma', 'Engineering Intern', 1),
+    ]
+
+    assert _ids(JobDeduplicator().deduplicate(jobs)) == ['1', '3']
+
+
+def test_find_duplicates_reports_pairs_in_list_order():
+    jobs = [
+        _job('1', 'Figma', 'Product Design Intern'),
+        _job('2', 'Stripe', 'UX Design Intern'),
+        _job('3', 'Figma', 'Product Design Intern'),
+        _job('4', 'Stripe', 'UX Design Intern'),
+    ]
+
+    pairs = [(a['id'], b['id']) for a, b, _ in JobDeduplicator().find_duplicates(jobs)]
+    assert pairs == [('1', '3'), ('2', '4')]
+
+
+def test_empty_input():
+    assert JobDeduplicator().deduplicate([]) == []
@@ -0,0 +1,47 @@
+"""
+Tests that the Jooble API key (part of the request URL) is never written to disk
+"""
+
+import orjson
+import requests
+from requests.adapters import BaseAdapter
+
+from scrapers import http_cache
+from config import Config
+from scrapers.jooble_scraper import JoobleScraper
+
+API_KEY = 'jooble-secret-key-123'
+
+
+class FakeJoobleAdapter(BaseAdapter):
+    """Answers every search with one job"""
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response.headers['Content-Type'] = 'application/json'
+        response._content = orjson.dumps({'jobs': [{
+            'id': 1, 'title': 'UX Design Intern', 'company': 'Figma',
+            'link': 'https://jooble.org/desc/1', 'updated': '2026-01-01T00:00:00',
+        }]})
+        return response
+
+    def close(self):
+        pass
+
+
+def test_api_key_never_reaches_the_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, 'CACHE_DIR', tmp_path)
+
+    scraper = JoobleScraper(config=Config(jooble_api_key=API_KEY))
+    scraper.session.mount('https://', FakeJoobleAdapter())
+
+    assert len(scraper.fetch_jobs()) == 1
+    assert len(scraper.fetch_jobs()) == 1
+    scraper.session.close()
+
+    for path in tmp_path.rglob('*'):
+        if path.is_file():
+            assert API_KEY.encode() not in path.read_bytes(), path
@@ -0,0 +1,94 @@
+"""
+Tests for the Lever 404 cache (.cache/lever_404.json)
+"""
+
+from types import SimpleNamespace
+
+import orjson
+import pytest
+import requests
+
+from scrapers import lever_scraper
+from scrapers.lever_scraper import LeverScraper
+
+DAY = 86400
+START = 1_760_000_000.0
+
+
+class FakeSession:
+    """Serves Lever board responses by handle and records which were requested"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        handle = url.rsplit('/', 1)[-1]
+        self.requested.append(handle)
+        response = requests.Response()
+        response.status_code = self.statuses[handle]
+        response.url = url
+        response._content = b'[]'
+        return response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen time.time() for the scraper, advanced by setting clock.now"""
+    frozen = SimpleNamespace(now=START)
+    monkeypatch.setattr(lever_scraper, 'time', SimpleNamespace(time=lambda: frozen.now))
+    return frozen
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / '.cache' / 'lever_404.json'
+    monkeypatch.setattr(LeverScraper, 'NOT_FOUND_CACHE_FILE', path)
+    return path
+
+
+def _scrape(statuses, handles):
+    scraper = LeverScraper()
+    scraper.session = FakeSession(statuses)
+    scraper.fetch_multiple_companies([{'name': handle.title(), 'lever': handle} for handle in handles])
+    return scraper.session.requested
+
+
+def test_404_is_cached_and_skipped_within_ttl(clock, cache_file):
+    statuses = {'gone': 404, 'live': 200}
+
+    assert sorted(_scrape(statuses, ['gone', 'live'])) == ['gone', 'live']
+    assert orjson.loads(cache_file.read_bytes()) == {'gone': START}
+
+    clock.now = START + LeverScraper.NOT_FOUND_TTL - 1
+    assert _scrape(statuses, ['gone', 'live']) == ['live']
+
+
+def test_404_is_reprobed_after_ttl(clock, cache_file):
+    statuses = {'gone': 404}
+    _scrape(statuses, ['gone'])
+
+    clock.now = START + LeverScraper.NOT_FOUND_TTL
+    assert _scrape(statuses, ['gone']) == ['gone']
+
+    # Still missing, so the 404 time moves forward
+    assert orjson.loads(cache_file.read_bytes()) == {'gone': START + LeverScraper.NOT_FOUND_TTL}
+
+
+def test_handle_is_cleared_when_it_comes_back(clock, cache_file):
+    _scrape({'moved': 404}, ['moved'])
+
+    clock.now = START + 8 * DAY
+    assert _scrape({'moved': 200}, ['moved']) == ['moved']
+    assert orjson.loads(cache_file.read_bytes()) == {}
+
+    clock.now = START + 9 * DAY
+    assert _scrape({'moved': 200}, ['moved']) == ['moved']
+
+
+def test_unreadable_cache_is_ignored(clock, cache_file):
+    cache_file.parent.mkdir()
+    cache_file.write_text('{not json')
+
+    assert _scrape({'live': 200}, ['live']) == ['live']
+    assert orjson.loads(cache_file.read_bytes()) == {}
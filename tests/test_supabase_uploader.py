@@ -0,0 +1,124 @@
+"""
+Tests for SupabaseUploader's chunked upload against an in-memory client
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import supabase_uploader
+from config import Config
+from supabase_uploader import SupabaseUploader
+
+
+class FakeQuery:
+    """The slice of the PostgREST query builder the uploader uses"""
+
+    def __init__(self, client):
+        self.client = client
+        self.op = None
+
+    def select(self, column, count=None):
+        self.op = ('select', column)
+        return self
+
+    def in_(self, column, values):
+        self.values = set(values)
+        return self
+
+    def upsert(self, rows, on_conflict):
+        self.op = ('upsert', rows, on_conflict)
+        return self
+
+    def execute(self):
+        if self.op[0] == 'select':
+            return SimpleNamespace(data=[{'url': url} for url in self.client.urls if url in self.values])
+
+        _, rows, on_conflict = self.op
+        batch = isinstance(rows, list)
+        rows = rows if batch else [rows]
+        if batch and self.client.fail_batches:
+            raise RuntimeError('batch rejected')
+        if any(row['id'] in self.client.bad_ids for row in rows):
+            raise RuntimeError('row rejected')
+
+        with self.client.lock:
+            self.client.urls.update(row['url'] for row in rows)
+            self.client.upserts.append((len(rows), on_conflict))
+        return SimpleNamespace(data=rows)
+
+
+class FakeClient:
+    """Supabase client holding the intern_jobs URLs in a set"""
+
+    def __init__(self, urls=(), fail_batches=False, bad_ids=()):
+        self.urls = set(urls)
+        self.fail_batches = fail_batches
+        self.bad_ids = set(bad_ids)
+        self.upserts = []
+        self.lock = threading.Lock()
+
+    def table(self, name):
+        assert name == 'intern_jobs'
+        return FakeQuery(self)
+
+
+def _job(n):
+    return {'id': f'job_{n}', 'title': 'Design Intern', 'company': f'Company {n}',
+            'url': f'https://example.com/jobs/{n}'}
+
+
+@pytest.fixture
+def make_uploader(monkeypatch):
+    def make(client, chunk_size=4):
+        monkeypatch.setattr(supabase_uploader, 'create_client', lambda url, key: client)
+        uploader = SupabaseUploader(Config(supabase_url='https://db.example', supabase_key='key'))
+        uploader.UPSERT_CHUNK_SIZE = chunk_size
+        uploader.URL_PROBE_SIZE = 3
+        return uploader
+    return make
+
+
+def test_counts_new_and_existing_jobs(make_uploader, capsys):
+    jobs = [_job(n) for n in range(10)]
+    client = FakeClient(urls=[jobs[1]['url'], jobs[4]['url'], jobs[9]['url']])
+    uploader = make_uploader(client)
+
+    assert uploader.upload_jobs(jobs) == 7
+    assert uploader.new_jobs_count == 7
+    assert uploader.uploaded_count == 10
+    assert uploader.error_count == 0
+    assert sorted(size for size, _ in client.upserts) == [2, 4, 4]
+    assert {on_conflict for _, on_conflict in client.upserts} == {'url'}
+    assert "→ 3 existing jobs updated" in capsys.readouterr().out
+
+
+def test_streamed_jobs_are_uploaded(make_uploader):
+    client = FakeClient()
+    uploader = make_uploader(client)
+    uploader.MAX_WORKERS = 2
+
+    assert uploader.upload_jobs(_job(n) for n in range(25)) == 25
+    assert uploader.uploaded_count == 25
+    assert len(client.urls) == 25
+
+
+def test_empty_input_uploads_nothing(make_uploader):
+    client = FakeClient()
+    uploader = make_uploader(client)
+
+    assert uploader.upload_jobs(iter([])) == 0
+    assert client.upserts == []
+
+
+def test_failed_chunk_falls_back_to_individual_uploads(make_uploader):
+    jobs = [_job(n) for n in range(6)]
+    client = FakeClient(urls=[jobs[0]['url']], fail_batches=True, bad_ids={'job_3'})
+    uploader = make_uploader(client)
+
+    assert uploader.upload_jobs(jobs) == 5
+    assert uploader.uploaded_count == 5
+    assert uploader.error_count == 1
+    assert client.upserts == [(1, 'id')] * 5
+    assert jobs[3]['url'] not in client.urls